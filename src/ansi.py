@@ -0,0 +1,16 @@
+"""Precomputed ANSI color wrapping for console output."""
+
+from termcolor import colored
+
+# ANSI (prefix, suffix) per color, resolved once so runtime output
+# skips termcolor's per-call lookups
+_COLOR_WRAP = {
+    color: tuple(colored("\0", color).split("\0"))
+    for color in ("green", "yellow", "red", "magenta", "cyan", "white")
+}
+
+
+def paint(text: str, color: str) -> str:
+    """Wrap text in a precomputed ANSI color (same output as colored())."""
+    prefix, suffix = _COLOR_WRAP[color]
+    return prefix + text + suffix
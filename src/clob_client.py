@@ -1,8 +1,13 @@
 """CLOB API wrapper for Polymarket order operations."""
 
+import socket
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, ROUND_DOWN
-from typing import Optional
+from math import gcd
+from operator import attrgetter, itemgetter
+from typing import NamedTuple, Optional
 
 import httpx
 from py_clob_client.client import ClobClient
@@ -10,7 +15,43 @@ from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
 from py_clob_client.constants import POLYGON
 from py_clob_client.http_helpers import helpers as _clob_http_helpers
 
-from .config import Config
+from .config import Config, clear_cached_api_creds, load_cached_api_creds, save_cached_api_creds
+
+
+_CENT = Decimal("0.01")  # One cent / two-decimal quantum
+
+# Flush small order POSTs immediately (no Nagle coalescing) and have the OS
+# probe idle connections so NATs don't silently drop them between signals.
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):  # Linux; not available on macOS
+    _SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30),
+    ]
+
+
+class CleanAmounts(NamedTuple):
+    """Order size/price satisfying the ≤2-decimal product constraint."""
+
+    size: float
+    price: float
+    size_c: int  # Size in hundredths of a share
+    price_c: int  # Price in cents
+
+
+class OrderSubmitResult(NamedTuple):
+    """Outcome of placing an order (see FastClobClient._parse_order_result)."""
+
+    success: bool
+    error_msg: Optional[str] = None
+    order_id: Optional[str] = None
+    filled: float = 0.0
+    requested: Optional[float] = None
+    price: Optional[float] = None  # Average fill price, else submitted price
+    raw: object = None  # Exchange response
 
 
 class FastClobClient:
@@ -18,6 +59,28 @@ class FastClobClient:
 
     CLOB_HOST = "https://clob.polymarket.com"
 
+    # Order books younger than this are served from cache (REST fallback path)
+    ORDER_BOOK_TTL_SEC = 0.3
+
+    # Short-lived caches that coalesce concurrent fill lookups (burst exits)
+    ORDER_DETAILS_TTL_SEC = 0.05
+    TRADES_TTL_SEC = 0.1
+
+    # Re-ping /time this often so the pooled connection never reaches
+    # keepalive_expiry (600s) while the bot sits idle between signals
+    KEEPALIVE_INTERVAL_SEC = 400
+
+    # Sleep before each fill-status poll when the order response has no fill
+    # data. Backoff returns early when the exchange publishes fills quickly.
+    FILL_POLL_DELAYS = (0.0, 0.05, 0.1, 0.15)
+
+    # How long to wait for a pushed fill from the user WebSocket before
+    # falling back to REST polling (only when a UserStream is attached)
+    WS_FILL_WAIT_SEC = 0.15
+
+    # Order-status field names that may carry the matched size, by priority
+    _FILLED_KEYS = ("size_matched", "sizeMatched", "matched_amount")
+
     def __init__(self, config: Config):
         self.config = config
 
@@ -31,23 +94,102 @@ class FastClobClient:
             signature_type=2,
         )
 
-        # Derive API credentials from private key (ensures they match)
-        self.client.set_api_creds(self.client.derive_api_key())
+        self.client.set_api_creds(self._load_api_creds())
 
         # Replace the library's default httpx.Client with optimized settings.
         # Default keepalive_expiry is only 5s; after idle periods the connection
         # drops and each request pays ~300-400ms for TCP+TLS+HTTP/2 setup.
         # Setting keepalive_expiry=600 (10 min) keeps the connection warm.
+        # Pool/HTTP2 settings live on the transport so socket options apply.
         _clob_http_helpers._http_client = httpx.Client(
-            http2=True,
             timeout=httpx.Timeout(10.0, connect=5.0),
-            limits=httpx.Limits(
-                max_keepalive_connections=5,
-                max_connections=10,
-                keepalive_expiry=600,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=5,
+                    max_connections=10,
+                    keepalive_expiry=600,
+                ),
+                socket_options=_SOCKET_OPTIONS,
             ),
         )
 
+        # Price accessor for book levels, chosen on first use (object vs dict)
+        self._level_price = None
+
+        # token_id -> (fetched_at monotonic seconds, book)
+        self._book_cache: dict[str, tuple[float, object]] = {}
+
+        # order_id -> (fetched_at, details); last get_trades response
+        self._order_cache: dict[str, tuple[float, Optional[dict]]] = {}
+        self._trades_cache: Optional[tuple[float, list]] = None
+        self._trades_lock = threading.Lock()
+
+        # Fills pushed by the user WebSocket: order_id -> (filled, avg_price)
+        self._ws_fills: dict[str, tuple[float, float]] = {}
+        self._ws_fill_cond = threading.Condition()
+        self.ws_fills_active = False  # Set by UserStream while connected
+
+        # Small pool for concurrent REST reads (order books, trade lookups).
+        # All workers share the HTTP/2 client above, so parallel GETs
+        # multiplex as separate streams on one warm connection instead of
+        # stacking round-trips.
+        self._rest_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="clob-rest")
+
+        # Pre-signed FAK buy per token, built off the order path whenever the
+        # ask moves so an entry only has to POST:
+        # token_id -> ((ask_c, amount_c, slippage_cents), signed_order)
+        self._buy_drafts: dict[str, tuple[tuple[int, int, int], object]] = {}
+        self._draft_lock = threading.Lock()
+        # Latest presign request per token (older ones are superseded) and the
+        # ask it was made at, so repeat ticks at one price don't re-queue
+        self._presign_pending: dict[str, tuple[float, float, int]] = {}
+        self._presign_ask: dict[str, float] = {}
+        self._presign_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="order-presign")
+
+        # Background heartbeat keeps the HTTP/2 connection warm indefinitely
+        self._stop_event = threading.Event()
+        self._keepalive_thread = threading.Thread(target=self._keepalive_loop, daemon=True)
+        self._keepalive_thread.start()
+
+    def _load_api_creds(self) -> ApiCreds:
+        """Get L2 API credentials without re-deriving them on every startup.
+
+        Credentials are deterministic per signing key, so the first
+        derive_api_key() result (EIP-712 signing + network round-trip) is
+        cached on disk keyed by signer address and reused afterwards.
+
+        Cached credentials are checked once with a cheap L2 call; if the
+        server rejects them (key revoked or rotated), the cache is dropped
+        and they are derived again.
+        """
+        signer_address = self.client.get_address()
+        cached = load_cached_api_creds(signer_address)
+        if cached:
+            creds = ApiCreds(**cached)
+            self.client.set_api_creds(creds)
+            try:
+                self.client.get_api_keys()
+                return creds
+            except Exception as e:
+                # Only an auth rejection invalidates the cache; on network
+                # errors keep the cached creds rather than fail startup
+                if getattr(e, "status_code", None) not in (401, 403):
+                    return creds
+            clear_cached_api_creds()
+
+        # Derive API credentials from private key (ensures they match)
+        creds = self.client.derive_api_key()
+        try:
+            save_cached_api_creds(signer_address, {
+                "api_key": creds.api_key,
+                "api_secret": creds.api_secret,
+                "api_passphrase": creds.api_passphrase,
+            })
+        except OSError:
+            pass  # Non-critical; derive again next startup
+        return creds
+
     def warm_up(self):
         """Pre-establish the HTTP/2 connection to Polymarket.
 
@@ -60,51 +202,132 @@ class FastClobClient:
         except Exception:
             pass  # Non-critical; connection will be established on first real call
 
+    def _keepalive_loop(self):
+        """Re-ping the server before the pooled connection's keepalive expires."""
+        while not self._stop_event.wait(self.KEEPALIVE_INTERVAL_SEC):
+            self.warm_up()
+
+    def close(self):
+        """Stop the keepalive heartbeat and release pooled connections."""
+        self._stop_event.set()
+        self._rest_pool.shutdown(wait=False)
+        self._presign_pool.shutdown(wait=False, cancel_futures=True)
+        try:
+            _clob_http_helpers._http_client.close()
+        except Exception:
+            pass
+
     def get_order_book(self, token_id: str) -> dict:
-        """Get full order book for a token."""
-        return self.client.get_order_book(token_id)
+        """Get full order book for a token.
 
-    def get_best_ask(self, token_id: str) -> Optional[float]:
-        """Get best ask price for entry orders."""
-        book = self.get_order_book(token_id)
+        Books are cached for ORDER_BOOK_TTL_SEC so rapid back-to-back reads
+        of the same token (e.g. bid + ask during a pre-trade check) collapse
+        into a single REST call.
+        """
+        now = time.monotonic()
+        cached = self._book_cache.get(token_id)
+        if cached is not None and now - cached[0] < self.ORDER_BOOK_TTL_SEC:
+            return cached[1]
+        book = self.client.get_order_book(token_id)
+        self._book_cache[token_id] = (now, book)
+        return book
+
+    def get_order_books(self, token_ids: list[str]) -> dict:
+        """Fetch order books for several tokens in one concurrent round-trip.
+
+        Duplicate IDs and books still fresh in the cache are resolved locally;
+        only the remaining tokens are fetched, as parallel HTTP/2 streams.
+
+        Returns:
+            Dict of token_id -> book
+        """
+        now = time.monotonic()
+        books = {}
+        to_fetch = []
+        for tid in dict.fromkeys(token_ids):
+            cached = self._book_cache.get(tid)
+            if cached is not None and now - cached[0] < self.ORDER_BOOK_TTL_SEC:
+                books[tid] = cached[1]
+            else:
+                to_fetch.append(tid)
+
+        if len(to_fetch) == 1:
+            books[to_fetch[0]] = self.get_order_book(to_fetch[0])
+        elif to_fetch:
+            books.update(zip(to_fetch, self._rest_pool.map(self.get_order_book, to_fetch)))
+        return books
+
+    def _extract_best(self, book, side: str) -> Optional[float]:
+        """Extract best price for one side ("ask" or "bid") of an order book."""
         # OrderBookSummary has asks/bids as attributes
         # IMPORTANT: asks are sorted descending (worst=0.99 to best=lowest)
-        # So best ask (lowest price) is at the END of the array
-        asks = book.asks if hasattr(book, "asks") else []
-        if asks:
-            best_ask = asks[-1]  # Last element = lowest price = best ask
-            # Handle both object and dict formats
-            if hasattr(best_ask, "price"):
-                return float(best_ask.price)
-            elif isinstance(best_ask, dict):
-                return float(best_ask["price"])
-        return None
+        # and bids ascending (worst=0.01 to best=highest), so the best level
+        # on either side is at the END of the array
+        levels = getattr(book, "asks" if side == "ask" else "bids", None)
+        if not levels:
+            return None
+        best = levels[-1]
+
+        # Fast path: level schema already probed
+        level_price = self._level_price
+        if level_price is not None:
+            try:
+                return float(level_price(best))
+            except (AttributeError, KeyError, TypeError):
+                pass
+
+        # Probe schema once (object or dict levels) and specialize
+        if hasattr(best, "price"):
+            self._level_price = attrgetter("price")
+        elif isinstance(best, dict):
+            self._level_price = itemgetter("price")
+        else:
+            return None
+        return float(self._level_price(best))
 
-    def get_best_bid(self, token_id: str) -> Optional[float]:
-        """Get best bid price for exit orders."""
-        book = self.get_order_book(token_id)
-        # OrderBookSummary has asks/bids as attributes
-        # IMPORTANT: bids are sorted ascending (worst=0.01 to best=highest)
-        # So best bid (highest price) is at the END of the array
-        bids = book.bids if hasattr(book, "bids") else []
-        if bids:
-            best_bid = bids[-1]  # Last element = highest price = best bid
-            # Handle both object and dict formats
-            if hasattr(best_bid, "price"):
-                return float(best_bid.price)
-            elif isinstance(best_bid, dict):
-                return float(best_bid["price"])
-        return None
+    def get_best_ask(self, token_id: str, book=None) -> Optional[float]:
+        """Get best ask price for entry orders (pass `book` to skip the fetch)."""
+        if book is None:
+            book = self.get_order_book(token_id)
+        return self._extract_best(book, "ask")
+
+    def get_best_bid(self, token_id: str, book=None) -> Optional[float]:
+        """Get best bid price for exit orders (pass `book` to skip the fetch)."""
+        if book is None:
+            book = self.get_order_book(token_id)
+        return self._extract_best(book, "bid")
 
     def get_midpoint(self, token_id: str) -> Optional[float]:
-        """Get midpoint price."""
-        best_ask = self.get_best_ask(token_id)
-        best_bid = self.get_best_bid(token_id)
+        """Get midpoint price.
+
+        Uses the lightweight /midpoint endpoint (a single number instead of
+        the full book); falls back to one order book fetch if it fails.
+        """
+        try:
+            mid = float(self.client.get_midpoint(token_id)["mid"])
+            if mid > 0:
+                return mid
+        except Exception:
+            pass
+
+        book = self.get_order_book(token_id)
+        best_ask = self._extract_best(book, "ask")
+        best_bid = self._extract_best(book, "bid")
         if best_ask and best_bid:
             return (best_ask + best_bid) / 2
         return best_ask or best_bid
 
-    def _clean_order_amounts(self, size: float, price: float) -> tuple[float, float]:
+    @staticmethod
+    def _to_cents(x: float) -> int:
+        """Convert a dollar/share float to integer hundredths (rounded down)."""
+        return int(Decimal(repr(x)).quantize(_CENT, rounding=ROUND_DOWN) * 100)
+
+    @staticmethod
+    def _from_cents(c: int) -> float:
+        """Convert integer hundredths back to a float."""
+        return c / 100
+
+    def _clean_order_amounts(self, size: float, price: float) -> CleanAmounts:
         """
         Ensure size × price has at most 2 decimal places.
 
@@ -117,36 +340,137 @@ class FastClobClient:
         This ensures small remaining amounts from partial fills can still be sold.
 
         Returns:
-            Tuple of (adjusted_size, price) as floats
+            CleanAmounts with the adjusted size and price as floats and as
+            integer cents (size_c == 0 if no valid size exists)
         """
-        d_original_size = Decimal(str(size)).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
-        d_price = Decimal(str(price)).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
+        size_c, price_c = self._clean_order_cents(self._to_cents(size), self._to_cents(price))
+        return CleanAmounts(self._from_cents(size_c), self._from_cents(price_c), size_c, price_c)
+
+    @staticmethod
+    def _clean_order_cents(size_c: int, price_c: int) -> tuple[int, int]:
+        """Integer-cent core of _clean_order_amounts (size_c == 0 if none found)."""
+        original_price_c = price_c
+
+        # In integer cents, size × price has ≤2 decimals iff
+        # (size_c * price_c) % 100 == 0, i.e. size_c is a multiple of
+        # 100 // gcd(100, price_c). Round size down to that step directly.
 
         # Try the given price first, then adjust price down by 1 cent at a time
         max_price_adjustments = 5  # At most 5 cents worse
         for _ in range(max_price_adjustments + 1):
-            if d_price <= 0:
+            if price_c <= 0:
                 break
 
-            d_size = d_original_size
-            while d_size > 0:
-                product = d_size * d_price
-                if product == product.quantize(Decimal("0.01")):
-                    return float(d_size), float(d_price)
-                d_size -= Decimal("0.01")
+            step = 100 // gcd(100, price_c)
+            valid_size_c = (size_c // step) * step
+            if valid_size_c > 0:
+                return valid_size_c, price_c
 
             # No valid size at this price, try 1 cent lower
-            d_price -= Decimal("0.01")
+            price_c -= 1
 
-        return 0.0, float(Decimal(str(price)).quantize(Decimal("0.01"), rounding=ROUND_DOWN))
+        return 0, original_price_c
+
+    @classmethod
+    def _market_buy_cents(cls, ask_c: int, amount_c: int, slippage_cents: int) -> tuple[int, int]:
+        """(size_c, price_c) for a FAK buy of amount_c at ask_c plus slippage."""
+        # 1. Whole shares at original ask (before slippage)
+        whole_size = amount_c // ask_c
+        if whole_size < 1:
+            whole_size = 1
+
+        # 2. Slippage only affects limit price, not share count (cap at $0.99)
+        limit_c = ask_c
+        if slippage_cents > 0:
+            limit_c = min(ask_c + slippage_cents, 99)
+
+        # 3. Cap USDC commitment to whole_size * original_ask.
+        #    This bounds the fill: at the original ask, we receive at most
+        #    whole_size shares. Price improvement may still produce a small
+        #    fractional part, but never more than whole_size total.
+        target_usdc_c = whole_size * ask_c
+        capped_size_c = target_usdc_c * 100 // limit_c
+
+        # Try the slippage limit price first. If _clean_order_cents can't
+        # find a valid pair (or drops the price below the original ask, which
+        # would make the FAK pointless), fall back to exact whole shares at
+        # the original ask -- that product (int × 2dp) always has ≤2 decimals.
+        size_c, price_c = cls._clean_order_cents(capped_size_c, limit_c)
+        if size_c <= 0 or price_c < ask_c:
+            size_c, price_c = whole_size * 100, ask_c
+        return size_c, price_c
+
+    def presign_market_buy(
+        self, token_id: str, dollar_amount: float, price: Optional[float],
+        slippage_cents: int = 0,
+    ):
+        """
+        Sign the FAK buy that place_market_buy would send at this ask, in the
+        background, so a matching entry skips order construction and ECDSA.
+
+        Cheap to call on every price tick: repeat asks are ignored and only
+        the latest request per token is signed.
+        """
+        if not price or self._presign_ask.get(token_id) == price:
+            return
+        self._presign_ask[token_id] = price
+        self._presign_pending[token_id] = (dollar_amount, price, slippage_cents)
+        try:
+            self._presign_pool.submit(self._presign_worker, token_id)
+        except RuntimeError:
+            pass  # Pool shut down (closing)
+
+    def _presign_worker(self, token_id: str):
+        """Background: sign the latest pending buy for token_id (no-op if a
+        queued earlier worker already took it)."""
+        request = self._presign_pending.pop(token_id, None)
+        if request is None:
+            return
+        dollar_amount, price, slippage_cents = request
+        ask_c = self._to_cents(price)
+        if ask_c <= 0:
+            return
+        key = (ask_c, self._to_cents(dollar_amount), slippage_cents)
+        draft = self._buy_drafts.get(token_id)
+        if draft is not None and draft[0] == key:
+            return
+
+        size_c, price_c = self._market_buy_cents(*key)
+        try:
+            signed_order = self.client.create_order(OrderArgs(
+                token_id=token_id,
+                price=self._from_cents(price_c),
+                size=self._from_cents(size_c),
+                side="BUY",
+            ))
+        except Exception:
+            # Let the next tick at this ask retry (unless a newer ask took over)
+            if self._presign_ask.get(token_id) == price:
+                self._presign_ask.pop(token_id, None)
+            return  # Entry will sign inline
+        with self._draft_lock:
+            self._buy_drafts[token_id] = (key, signed_order)
+
+    def _take_buy_draft(self, token_id: str, key: tuple[int, int, int]):
+        """Claim the pre-signed buy for token_id if it matches key (single use)."""
+        with self._draft_lock:
+            draft = self._buy_drafts.pop(token_id, None)
+        # A signed order can only be posted once; re-sign on the next tick
+        self._presign_ask.pop(token_id, None)
+        if draft is not None and draft[0] == key:
+            return draft[1]
+        return None
 
     def place_market_buy(
         self, token_id: str, dollar_amount: float, price: Optional[float] = None,
         slippage_cents: int = 0,
-    ) -> dict:
+    ) -> OrderSubmitResult:
         """
         Place a market buy order (FAK at best ask).
 
+        Uses the order pre-signed by presign_market_buy when it was built for
+        the same ask, size and slippage; otherwise signs inline.
+
         Args:
             token_id: The token to buy
             dollar_amount: Amount in dollars to spend
@@ -154,63 +478,43 @@ class FastClobClient:
             slippage_cents: Cents of slippage tolerance added to limit price
 
         Returns:
-            Order result dict with 'success', 'orderID', etc.
+            OrderSubmitResult
         """
         # Use provided price or fetch from REST API
         best_ask = price if price is not None else self.get_best_ask(token_id)
         if not best_ask:
-            return {"success": False, "errorMsg": "No asks available"}
-
-        d_original_price = Decimal(str(best_ask)).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
-        d_amount = Decimal(str(dollar_amount))
+            return OrderSubmitResult(False, error_msg="No asks available")
 
-        # 1. Whole shares at original ask (before slippage)
-        whole_size = int((d_amount / d_original_price).to_integral_value(rounding=ROUND_DOWN))
-        if whole_size < 1:
-            whole_size = 1
+        # All share/price math below is in integer cents (hundredths)
+        ask_c = self._to_cents(best_ask)
+        if ask_c <= 0:
+            return OrderSubmitResult(False, error_msg="No asks available")
+        amount_c = self._to_cents(dollar_amount)
 
-        # 2. Slippage only affects limit price, not share count
-        limit_price = best_ask
-        if slippage_cents > 0:
-            limit_price = min(best_ask + slippage_cents / 100, 0.99)
-        d_limit = Decimal(str(limit_price)).quantize(Decimal("0.01"), rounding=ROUND_DOWN)
-
-        # 3. Cap USDC commitment to whole_size * original_ask.
-        #    This bounds the fill: at the original ask, we receive at most
-        #    whole_size shares. Price improvement may still produce a small
-        #    fractional part, but never more than whole_size total.
-        target_usdc = Decimal(str(whole_size)) * d_original_price
-        capped_size = float((target_usdc / d_limit).quantize(Decimal("0.01"), rounding=ROUND_DOWN))
-
-        # Try the slippage limit price first. If _clean_order_amounts can't
-        # find a valid pair (or drops the price below the original ask, which
-        # would make the FAK pointless), fall back to exact whole shares at
-        # the original ask -- that product (int × 2dp) always has ≤2 decimals.
-        size, price = self._clean_order_amounts(capped_size, float(d_limit))
-        if size <= 0 or price < float(d_original_price):
-            size, price = float(whole_size), float(d_original_price)
+        size_c, price_c = self._market_buy_cents(ask_c, amount_c, slippage_cents)
+        size, price = self._from_cents(size_c), self._from_cents(price_c)
 
         if size <= 0:
-            return {"success": False, "errorMsg": "Calculated size is zero"}
-
-        order_args = OrderArgs(
-            token_id=token_id,
-            price=price,
-            size=size,
-            side="BUY",
-        )
+            return OrderSubmitResult(False, error_msg="Calculated size is zero")
 
         try:
-            signed_order = self.client.create_order(order_args)
+            signed_order = self._take_buy_draft(token_id, (ask_c, amount_c, slippage_cents))
+            if signed_order is None:
+                signed_order = self.client.create_order(OrderArgs(
+                    token_id=token_id,
+                    price=price,
+                    size=size,
+                    side="BUY",
+                ))
             result = self.client.post_order(signed_order, OrderType.FAK)
             return self._parse_order_result(result, size, price, token_id, "BUY")
         except Exception as e:
-            return {"success": False, "errorMsg": str(e)}
+            return OrderSubmitResult(False, error_msg=str(e))
 
     def place_market_sell(
         self, token_id: str, shares: float, price: Optional[float] = None,
         slippage_cents: int = 0,
-    ) -> dict:
+    ) -> OrderSubmitResult:
         """
         Place a market sell order (FAK at best bid or specified price).
 
@@ -221,38 +525,38 @@ class FastClobClient:
             slippage_cents: Cents of slippage tolerance subtracted from limit price
 
         Returns:
-            Order result dict with 'success', 'orderID', etc.
+            OrderSubmitResult
         """
         if price is None:
             price = self.get_best_bid(token_id)
         if not price:
-            return {"success": False, "errorMsg": "No bids available"}
+            return OrderSubmitResult(False, error_msg="No bids available")
 
         # Apply slippage tolerance for FAK fill reliability
         if slippage_cents > 0:
             price = max(price - slippage_cents / 100, 0.01)
 
-        # Use Decimal math to ensure product has ≤2 decimals
-        clean_size, clean_price = self._clean_order_amounts(shares, price)
+        # Use integer-cent math to ensure product has ≤2 decimals
+        clean = self._clean_order_amounts(shares, price)
 
-        if clean_size <= 0:
-            return {"success": False, "errorMsg": "Calculated size is zero"}
+        if clean.size_c <= 0:
+            return OrderSubmitResult(False, error_msg="Calculated size is zero")
 
         order_args = OrderArgs(
             token_id=token_id,
-            price=clean_price,
-            size=clean_size,
+            price=clean.price,
+            size=clean.size,
             side="SELL",
         )
 
         try:
             signed_order = self.client.create_order(order_args)
             result = self.client.post_order(signed_order, OrderType.FAK)
-            return self._parse_order_result(result, clean_size, clean_price, token_id, "SELL")
+            return self._parse_order_result(result, clean.size, clean.price, token_id, "SELL")
         except Exception as e:
-            return {"success": False, "errorMsg": str(e)}
+            return OrderSubmitResult(False, error_msg=str(e))
 
-    def place_limit_buy(self, token_id: str, shares: float, price: float) -> dict:
+    def place_limit_buy(self, token_id: str, shares: float, price: float) -> OrderSubmitResult:
         """
         Place a GTC limit buy order.
 
@@ -262,29 +566,29 @@ class FastClobClient:
             price: Limit price
 
         Returns:
-            Order result dict
+            OrderSubmitResult
         """
-        # Use Decimal math to ensure product has ≤2 decimals
-        clean_size, clean_price = self._clean_order_amounts(shares, price)
+        # Use integer-cent math to ensure product has ≤2 decimals
+        clean = self._clean_order_amounts(shares, price)
 
-        if clean_size <= 0:
-            return {"success": False, "errorMsg": "Calculated size is zero"}
+        if clean.size_c <= 0:
+            return OrderSubmitResult(False, error_msg="Calculated size is zero")
 
         order_args = OrderArgs(
             token_id=token_id,
-            price=clean_price,
-            size=clean_size,
+            price=clean.price,
+            size=clean.size,
             side="BUY",
         )
 
         try:
             signed_order = self.client.create_order(order_args)
             result = self.client.post_order(signed_order, OrderType.GTC)
-            return self._parse_order_result(result, clean_size, clean_price, token_id, "BUY")
+            return self._parse_order_result(result, clean.size, clean.price, token_id, "BUY")
         except Exception as e:
-            return {"success": False, "errorMsg": str(e)}
+            return OrderSubmitResult(False, error_msg=str(e))
 
-    def place_limit_sell(self, token_id: str, shares: float, price: float) -> dict:
+    def place_limit_sell(self, token_id: str, shares: float, price: float) -> OrderSubmitResult:
         """
         Place a GTC limit sell order (resting order on the book).
 
@@ -297,27 +601,27 @@ class FastClobClient:
             price: Limit price
 
         Returns:
-            Order result dict
+            OrderSubmitResult
         """
-        # Use Decimal math to ensure product has ≤2 decimals
-        clean_size, clean_price = self._clean_order_amounts(shares, price)
+        # Use integer-cent math to ensure product has ≤2 decimals
+        clean = self._clean_order_amounts(shares, price)
 
-        if clean_size <= 0:
-            return {"success": False, "errorMsg": "Calculated size is zero"}
+        if clean.size_c <= 0:
+            return OrderSubmitResult(False, error_msg="Calculated size is zero")
 
         order_args = OrderArgs(
             token_id=token_id,
-            price=clean_price,
-            size=clean_size,
+            price=clean.price,
+            size=clean.size,
             side="SELL",
         )
 
         try:
             signed_order = self.client.create_order(order_args)
             result = self.client.post_order(signed_order, OrderType.GTC)
-            return self._parse_order_result(result, clean_size, clean_price, token_id, "SELL")
+            return self._parse_order_result(result, clean.size, clean.price, token_id, "SELL")
         except Exception as e:
-            return {"success": False, "errorMsg": str(e)}
+            return OrderSubmitResult(False, error_msg=str(e))
 
     def cancel_order(self, order_id: str) -> dict:
         """Cancel an open order."""
@@ -335,6 +639,39 @@ class FastClobClient:
         except Exception as e:
             return {"success": False, "errorMsg": str(e)}
 
+    def record_fill(self, order_id: str, size: float, price: float):
+        """Record a fill pushed by the user WebSocket and wake any waiter."""
+        with self._ws_fill_cond:
+            prev_size, prev_price = self._ws_fills.get(order_id, (0.0, 0.0))
+            total = prev_size + size
+            avg_price = (prev_size * prev_price + size * price) / total
+            self._ws_fills[order_id] = (total, avg_price)
+            # Fills nobody waited for (response already had fill data)
+            # are dropped oldest-first to keep the map bounded
+            while len(self._ws_fills) > 256:
+                del self._ws_fills[next(iter(self._ws_fills))]
+            self._ws_fill_cond.notify_all()
+
+    def _wait_for_ws_fill(
+        self, order_id: str, target_size: float, timeout: float,
+    ) -> Optional[tuple[float, float]]:
+        """Wait up to `timeout` seconds for pushed fills for this order.
+
+        One match can arrive as several MATCHED events, so this keeps waiting
+        until their cumulative size reaches target_size (within half a
+        hundredth) or the window ends, then returns what has accumulated.
+        """
+        fills = self._ws_fills
+        min_size = target_size - 0.005
+
+        def filled_enough():
+            fill = fills.get(order_id)
+            return fill is not None and fill[0] >= min_size
+
+        with self._ws_fill_cond:
+            self._ws_fill_cond.wait_for(filled_enough, timeout)
+            return fills.pop(order_id, None)
+
     def get_open_orders(self) -> list:
         """Get all open orders."""
         try:
@@ -343,52 +680,96 @@ class FastClobClient:
             return []
 
     def get_order_details(self, order_id: str) -> Optional[dict]:
-        """Get details of a specific order including fill status."""
+        """Get details of a specific order including fill status.
+
+        Identical lookups started within ORDER_DETAILS_TTL_SEC share one
+        response. The TTL is shorter than the fill-poll spacing, so a single
+        poll loop always sees fresh data; only concurrent callers coalesce.
+        """
+        now = time.monotonic()
+        cached = self._order_cache.get(order_id)
+        if cached is not None and now - cached[0] < self.ORDER_DETAILS_TTL_SEC:
+            return cached[1]
         try:
-            return self.client.get_order(order_id)
+            details = self.client.get_order(order_id)
         except Exception:
             return None
+        cache = self._order_cache
+        # Prune expired lookups so the cache stays bounded to in-flight polls
+        for key, (fetched_at, _) in list(cache.items()):
+            if now - fetched_at >= self.ORDER_DETAILS_TTL_SEC:
+                cache.pop(key, None)
+        cache[order_id] = (now, details)
+        return details
 
-    def get_recent_trades(self, limit: int = 10) -> list:
-        """Get recent trades for this account."""
-        try:
-            trades = self.client.get_trades()
-            if isinstance(trades, list):
-                return trades[:limit]
-            return []
-        except Exception:
-            return []
+    def get_recent_trades(self, limit: int = 10, not_before: Optional[float] = None) -> list:
+        """Get recent trades for this account.
+
+        Overlapping callers are coalesced: while one thread fetches, others
+        wait on the lock and reuse that response instead of issuing their own.
 
-    def _get_fill_from_trades(self, order_id: str, token_id: str, side: str) -> Optional[dict]:
+        Args:
+            limit: Max trades to return
+            not_before: time.monotonic() stamp; only reuse a response whose
+                fetch started at or after it (e.g. after the caller's order
+                was posted, so the response can contain its trade)
+        """
+        with self._trades_lock:
+            cached = self._trades_cache
+            if (
+                cached is not None
+                and time.monotonic() - cached[0] < self.TRADES_TTL_SEC
+                and (not_before is None or cached[0] >= not_before)
+            ):
+                return cached[1][:limit]
+            started = time.monotonic()
+            try:
+                trades = self.client.get_trades()
+            except Exception:
+                return []
+            if not isinstance(trades, list):
+                return []
+            self._trades_cache = (started, trades)
+            return trades[:limit]
+
+    def _get_fill_from_trades(
+        self, order_id: str, token_id: str, side: str, not_before: Optional[float] = None,
+    ) -> Optional[dict]:
         """
         Find fill details from recent trades matching an order.
 
+        not_before is passed to get_recent_trades, so concurrent orders
+        never share a trades response fetched before this order was posted.
+
         Returns dict with 'filled' (size) and 'price' if found.
         """
-        trades = self.get_recent_trades(20)
+        trades = self.get_recent_trades(20, not_before=not_before)
+
+        # Prefer trades matched by our order ID. Single pass; only the first
+        # token+side match is kept as a fallback candidate.
+        matches = []
+        fallback = None
+        for trade in trades:
+            if order_id and order_id in trade.get("taker_order_id", ""):
+                matches.append(trade)
+            elif (
+                fallback is None
+                and trade.get("asset_id", "") == token_id
+                and trade.get("side", "").upper() == side
+            ):
+                fallback = trade
+
+        # Fallback: most recent trade for this token and side
+        if not matches and fallback is not None:
+            matches.append(fallback)
 
         total_filled = 0.0
         total_value = 0.0
-
-        for trade in trades:
-            # Match by taker_order_id or check if it's our trade for this token
-            taker_id = trade.get("taker_order_id", "")
-            trade_asset = trade.get("asset_id", "")
-            trade_side = trade.get("side", "").upper()
-
-            # Check if this trade matches our order
-            if order_id and order_id in taker_id:
-                size = float(trade.get("size", 0))
-                price = float(trade.get("price", 0))
-                total_filled += size
-                total_value += size * price
-            elif trade_asset == token_id and trade_side == side:
-                # Fallback: match by token and side for recent trades
-                size = float(trade.get("size", 0))
-                price = float(trade.get("price", 0))
-                total_filled += size
-                total_value += size * price
-                break  # Only take the most recent matching trade
+        for trade in matches:
+            size = float(trade.get("size", 0))
+            price = float(trade.get("price", 0))
+            total_filled += size
+            total_value += size * price
 
         if total_filled > 0:
             avg_price = total_value / total_filled
@@ -403,13 +784,16 @@ class FastClobClient:
         submitted_price: float,
         token_id: str = "",
         side: str = "",
-    ) -> dict:
+    ) -> OrderSubmitResult:
         """
-        Parse order result into standardized format.
+        Parse order result into an OrderSubmitResult.
 
         First checks for trades in the immediate response (FAK orders return
         fills directly). Falls back to querying order details if needed.
         """
+        # Called once post_order has returned, so any trades fetch started
+        # from here on can include this order's trade
+        posted_at = time.monotonic()
         if isinstance(result, dict):
             success = result.get("success", False) or result.get("status") == "matched"
             order_id = result.get("orderID") or result.get("order_id")
@@ -421,47 +805,64 @@ class FastClobClient:
             # Check for takingAmount/makingAmount in response (Polymarket FAK fill data)
             # For BUY: takingAmount = shares received, makingAmount = USDC spent
             # For SELL: takingAmount = USDC received, makingAmount = shares sold
-            taking = result.get("takingAmount")
-            making = result.get("makingAmount")
-
-            if taking and making:
-                try:
-                    taking_val = float(taking)
-                    making_val = float(making)
-                    if taking_val > 0 and making_val > 0:
-                        if side == "BUY":
-                            # BUY: taking=shares, making=USDC
-                            filled = taking_val
-                            fill_price = making_val / taking_val
-                        else:
-                            # SELL: taking=USDC, making=shares
-                            filled = making_val
-                            fill_price = taking_val / making_val
-                        # Round price to 2 decimals
-                        fill_price = round(fill_price, 2)
-                except (ValueError, TypeError, ZeroDivisionError):
-                    pass
-
-            # If no fill data from takingAmount/makingAmount, poll for fill data.
+            # Present on nearly every FAK fill, so index directly and let a
+            # missing/empty field fall through to the except clause.
+            try:
+                taking_val = float(result["takingAmount"])
+                making_val = float(result["makingAmount"])
+                if taking_val > 0 and making_val > 0:
+                    if side == "BUY":
+                        # BUY: taking=shares, making=USDC
+                        filled = taking_val
+                        fill_price = making_val / taking_val
+                    else:
+                        # SELL: taking=USDC, making=shares
+                        filled = making_val
+                        fill_price = taking_val / making_val
+                    # Round price to 2 decimals
+                    fill_price = round(fill_price, 2)
+            except (KeyError, ValueError, TypeError, ZeroDivisionError):
+                pass
+
+            # No fill data in the response: the user WebSocket usually pushes
+            # the match within milliseconds, so wait on that first.
+            if filled == 0 and success and order_id and self.ws_fills_active:
+                ws_fill = self._wait_for_ws_fill(order_id, requested_size, self.WS_FILL_WAIT_SEC)
+                if ws_fill is not None:
+                    filled, fill_price = ws_fill[0], round(ws_fill[1], 2)
+
+            # If still no fill data, poll for fill data over REST.
             # The exchange has already matched this order, so fill data should
-            # be available quickly. Use fast polling to minimize exit latency.
-            # (Reduced from 3 attempts with 0.5/1.0/1.5s sleeps = 3.0s total
-            #  to 2 attempts with 0/0.25s sleeps = 0.25s total.)
+            # be available quickly. Poll with a short backoff (0/50/100/150ms,
+            # 0.3s worst case) so the common fast case returns in ~one RTT.
             if filled == 0 and success and order_id:
-                for attempt in range(2):
-                    if attempt > 0:
-                        time.sleep(0.25)
+                last_attempt = len(self.FILL_POLL_DELAYS) - 1
+                for attempt, delay in enumerate(self.FILL_POLL_DELAYS):
+                    if delay:
+                        time.sleep(delay)
+
+                    # On the last attempt, check recent trades as a fallback
+                    # (extra REST call), overlapped with the order-status call
+                    trades_future = None
+                    trades_inline = False
+                    if attempt == last_attempt and token_id:
+                        try:
+                            trades_future = self._rest_pool.submit(
+                                self._get_fill_from_trades, order_id, token_id, side, posted_at
+                            )
+                        except RuntimeError:
+                            # Pool shut down (closing): the order is already
+                            # posted, so look the trades up inline instead
+                            trades_inline = True
 
                     # Try to get fill details from order status
                     order_details = self.get_order_details(order_id)
                     if order_details:
                         # Check various possible field names for fill data
-                        if "size_matched" in order_details:
-                            filled = float(order_details["size_matched"])
-                        elif "sizeMatched" in order_details:
-                            filled = float(order_details["sizeMatched"])
-                        elif "matched_amount" in order_details:
-                            filled = float(order_details["matched_amount"])
+                        filled = next(
+                            (float(order_details[k]) for k in self._FILLED_KEYS if k in order_details),
+                            filled,
+                        )
 
                         # Get actual fill price if available
                         if "average_price" in order_details:
@@ -473,9 +874,11 @@ class FastClobClient:
                     if filled > 0:
                         break
 
-                    # Check recent trades as fallback on last attempt (extra REST call)
-                    if attempt == 1 and filled == 0 and token_id:
-                        trade_fill = self._get_fill_from_trades(order_id, token_id, side)
+                    if trades_future is not None or trades_inline:
+                        if trades_future is not None:
+                            trade_fill = trades_future.result()
+                        else:
+                            trade_fill = self._get_fill_from_trades(order_id, token_id, side, posted_at)
                         if trade_fill:
                             filled = trade_fill["filled"]
                             fill_price = trade_fill["price"]
@@ -484,21 +887,20 @@ class FastClobClient:
                 if filled == 0 and success:
                     filled = requested_size
 
-            return {
-                "success": success,
-                "orderID": order_id,
-                "filled": filled,
-                "requested": requested_size,
-                "price": fill_price,
-                "errorMsg": error_msg,
-                "raw": result,
-            }
+            return OrderSubmitResult(
+                success=success,
+                error_msg=error_msg,
+                order_id=order_id,
+                filled=filled,
+                requested=requested_size,
+                price=fill_price,
+                raw=result,
+            )
 
         # String result (usually an error)
-        return {
-            "success": False,
-            "errorMsg": str(result),
-            "filled": 0.0,
-            "requested": requested_size,
-            "price": submitted_price,
-        }
+        return OrderSubmitResult(
+            success=False,
+            error_msg=str(result),
+            requested=requested_size,
+            price=submitted_price,
+        )
@@ -0,0 +1,16 @@
+"""Cheap wall-clock formatting for console timestamps."""
+
+import time
+
+# (epoch second, "HH:MM:SS") -- UI timestamps only change once per second
+_hms_cache: list = [0, ""]
+
+
+def now_hms() -> str:
+    """Current UTC time as HH:MM:SS, formatted at most once per second."""
+    now = int(time.time())
+    cache = _hms_cache
+    if cache[0] != now:
+        cache[1] = time.strftime("%H:%M:%S", time.gmtime(now))
+        cache[0] = now
+    return cache[1]
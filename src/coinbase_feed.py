@@ -1,19 +1,36 @@
 """Coinbase WebSocket feed for BTC price volatility detection."""
 
 import asyncio
-import json
-from collections import deque
+import calendar
+import time
+from array import array
 from typing import Awaitable, Callable, Optional, Union
 
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
 # Signal callback type: can be sync or async
 SignalCallback = Union[Callable[[str], None], Callable[[str], Awaitable[None]]]
 
+# Coinbase sends compact JSON, so every match frame contains this literal
+_MATCH_MARKER = '"type":"match"'
+_MATCH_MARKER_BYTES = _MATCH_MARKER.encode()
+
+# "YYYY-MM-DD" -> epoch seconds at UTC midnight (one entry per trading day)
+_DAY_EPOCH_CACHE: dict[str, int] = {}
+
 
 class RollingWindow:
-    """Rolling window of price ticks for volatility calculation."""
+    """Rolling window of price ticks for volatility calculation.
+
+    Stored as two parallel ring buffers (times, prices) so adding a tick and
+    evicting old ones is index arithmetic with no per-tick allocation.
+    """
+
+    INITIAL_CAPACITY = 4096
+
+    __slots__ = ("window_ms", "_cap", "_t", "_p", "_head", "_size")
 
     def __init__(self, window_ms: int):
         """
@@ -23,22 +40,78 @@ class RollingWindow:
             window_ms: Window size in milliseconds
         """
         self.window_ms = window_ms
-        self._data: deque[tuple[float, float]] = deque()  # (time_ms, price)
+        self._cap = self.INITIAL_CAPACITY
+        self._t = array("d", bytes(8 * self._cap))  # time_ms
+        self._p = array("d", bytes(8 * self._cap))  # price
+        self._head = 0  # Index of oldest tick
+        self._size = 0
 
-    def add(self, time_ms: float, price: float):
+    def add(self, time_ms: float, price: float) -> Optional[float]:
         """
         Add a price tick and evict expired entries.
 
         Args:
             time_ms: Exchange timestamp in milliseconds
             price: Trade price
+
+        Returns:
+            Same value as get_pct_change() after the add, computed from the
+            indices already in hand so the tick path makes one call
         """
         # Evict entries older than window
         cutoff = time_ms - self.window_ms
-        while self._data and self._data[0][0] < cutoff:
-            self._data.popleft()
-
-        self._data.append((time_ms, price))
+        times = self._t
+        cap = self._cap
+        head = self._head
+        size = self._size
+        while size and times[head] < cutoff:
+            head = (head + 1) % cap
+            size -= 1
+        self._head = head
+        self._size = size
+
+        if size == cap:
+            self._grow()
+            cap = self._cap
+            head = 0
+
+        idx = (head + size) % cap
+        prices = self._p
+        self._t[idx] = time_ms
+        prices[idx] = price
+        self._size = size + 1
+
+        if not size:
+            return None
+        oldest_price = prices[head]
+        if oldest_price <= 0:
+            return None
+        return (price - oldest_price) / oldest_price
+
+    def _grow(self):
+        """Double capacity, unrolling the ring so the oldest tick is at 0."""
+        times, prices = self.ticks_arrays()
+        self._cap *= 2
+        padding = bytes(8 * (self._cap - self._size))
+        times.frombytes(padding)
+        prices.frombytes(padding)
+        self._t, self._p = times, prices
+        self._head = 0
+
+    def ticks_arrays(self) -> tuple[array, array]:
+        """Copy of (times, prices) in the window, oldest first."""
+        end = self._head + self._size
+        if end <= self._cap:
+            return self._t[self._head:end], self._p[self._head:end]
+        wrap = end - self._cap
+        return (
+            self._t[self._head:] + self._t[:wrap],
+            self._p[self._head:] + self._p[:wrap],
+        )
+
+    def ticks(self):
+        """Iterate (time_ms, price) pairs in the window, oldest first."""
+        return zip(*self.ticks_arrays())
 
     def get_pct_change(self) -> Optional[float]:
         """
@@ -47,11 +120,11 @@ class RollingWindow:
         Returns:
             Percentage change as decimal (e.g., 0.001 = 0.1%), or None if insufficient data
         """
-        if len(self._data) < 2:
+        if self._size < 2:
             return None
 
-        oldest_price = self._data[0][1]
-        newest_price = self._data[-1][1]
+        oldest_price = self._p[self._head]
+        newest_price = self._p[(self._head + self._size - 1) % self._cap]
 
         if oldest_price <= 0:
             return None
@@ -60,10 +133,31 @@ class RollingWindow:
 
     def clear(self):
         """Clear all data from the window."""
-        self._data.clear()
+        self._head = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class WindowSnapshot:
+    """Point-in-time copy of window ticks, expanded to dicts only when logged.
+
+    Holds two flat arrays; DataLogger calls to_json() on its writer thread,
+    so the per-tick dicts are never built on the signal path.
+    """
+
+    __slots__ = ("times", "prices")
+
+    def __init__(self, times: array, prices: array):
+        self.times = times
+        self.prices = prices
+
+    def to_json(self) -> list[dict]:
+        return [{"time_ms": t, "price": p} for t, p in zip(self.times, self.prices)]
 
     def __len__(self) -> int:
-        return len(self._data)
+        return len(self.times)
 
 
 class CoinbaseFeed:
@@ -71,6 +165,28 @@ class CoinbaseFeed:
 
     WS_URL = "wss://ws-feed.exchange.coinbase.com"
     PRODUCT_ID = "BTC-USD"
+    # Serialized once; sent as a text frame (Coinbase expects text JSON)
+    SUBSCRIBE_MSG = orjson.dumps(
+        {"type": "subscribe", "product_ids": [PRODUCT_ID], "channels": ["matches"]}
+    ).decode()
+
+    __slots__ = (
+        "window",
+        "threshold",
+        "cooldown_ms",
+        "on_signal",
+        "_on_signal_is_async",
+        "on_connect",
+        "on_disconnect",
+        "data_logger",
+        "_last_signal_time",
+        "_last_signal_data",
+        "_snapshot_enabled",
+        "_running",
+        "is_paused",
+        "is_connected",
+        "latest_tick",
+    )
 
     def __init__(
         self,
@@ -81,6 +197,7 @@ class CoinbaseFeed:
         on_connect: Optional[Callable[[], None]] = None,
         on_disconnect: Optional[Callable[[], None]] = None,
         data_logger: Optional[object] = None,
+        snapshot: bool = False,
     ):
         """
         Initialize Coinbase feed.
@@ -94,21 +211,29 @@ class CoinbaseFeed:
             on_connect: Optional callback when connected
             on_disconnect: Optional callback when disconnected
             data_logger: Optional DataLogger for ws_event logging
+            snapshot: Capture window ticks into _last_signal_data on each
+                      signal (only needed when something logs them)
         """
         self.window = RollingWindow(window_ms)
         self.threshold = threshold
         self.cooldown_ms = cooldown_ms
         self.on_signal = on_signal
+        # Resolved once so dispatch doesn't type-check every result
+        self._on_signal_is_async = asyncio.iscoroutinefunction(on_signal)
         self.on_connect = on_connect
         self.on_disconnect = on_disconnect
         self.data_logger = data_logger
 
         self._last_signal_time: float = 0
         self._last_signal_data: Optional[dict] = None  # Snapshot when signal fires (for data logging)
+        self._snapshot_enabled = snapshot
         self._running = False
-        self._paused = False
-        self._ws = None
-        self._latest_price: float = 0.0  # Latest BTC price (thread-safe atomic float)
+        # Plain attributes (not properties) so status reads are a single lookup
+        self.is_paused = False
+        self.is_connected = False
+        # (latest BTC price, monotonic_ns when received); replaced as one
+        # tuple so readers on other threads always see a matching pair
+        self.latest_tick: tuple[float, int] = (0.0, 0)
 
     async def connect(self):
         """Connect to Coinbase WebSocket and start processing matches."""
@@ -116,20 +241,21 @@ class CoinbaseFeed:
 
         while self._running:
             try:
-                async with websockets.connect(self.WS_URL) as ws:
-                    self._ws = ws
+                async with websockets.connect(
+                    self.WS_URL,
+                    compression=None,  # Frames are tiny; deflate just burns CPU
+                    max_size=2**20,
+                    max_queue=1024,  # Absorb bursts without pausing the socket reader
+                    write_limit=2**20,
+                ) as ws:
+                    self.is_connected = True
 
                     # Clear window on connect (stale data)
                     self.window.clear()
                     self._last_signal_time = 0
 
                     # Subscribe to matches channel
-                    subscribe_msg = {
-                        "type": "subscribe",
-                        "product_ids": [self.PRODUCT_ID],
-                        "channels": ["matches"],
-                    }
-                    await ws.send(json.dumps(subscribe_msg))
+                    await ws.send(self.SUBSCRIBE_MSG)
 
                     if self.on_connect:
                         self.on_connect()
@@ -156,7 +282,7 @@ class CoinbaseFeed:
                     self.window.clear()
                     await asyncio.sleep(1)
 
-        self._ws = None
+        self.is_connected = False
 
     def stop(self):
         """Stop the feed."""
@@ -164,40 +290,39 @@ class CoinbaseFeed:
 
     def pause(self):
         """Pause signal generation (still processes data)."""
-        self._paused = True
+        self.is_paused = True
 
     def resume(self):
         """Resume signal generation."""
-        self._paused = False
-
-    @property
-    def is_paused(self) -> bool:
-        return self._paused
-
-    @property
-    def is_connected(self) -> bool:
-        return self._ws is not None
+        self.is_paused = False
 
     @property
     def latest_price(self) -> float:
         """Latest BTC-USD price from Coinbase (thread-safe read)."""
-        return self._latest_price
+        return self.latest_tick[0]
 
-    def _process_message(self, message: str):
+    def _process_message(self, message: Union[str, bytes]):
         """Process incoming WebSocket message."""
+        # Only match frames drive volatility; reject heartbeats, subscription
+        # acks, last_match etc. with a substring scan before parsing JSON
+        marker = _MATCH_MARKER_BYTES if isinstance(message, bytes) else _MATCH_MARKER
+        if marker not in message:
+            return
+
         try:
-            data = json.loads(message)
+            data = orjson.loads(message)
             if data.get("type") == "match":
                 self._handle_match(data)
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
     def _handle_match(self, data: dict):
         """Handle a match (trade) message."""
-        # Extract price and exchange timestamp
+        # Extract price and exchange timestamp (always present on match
+        # frames; a malformed frame falls through to the except clause)
         try:
-            price = float(data.get("price", 0))
-            time_str = data.get("time", "")
+            price = float(data["price"])
+            time_str = data["time"]
 
             if price <= 0 or not time_str:
                 return
@@ -208,49 +333,62 @@ class CoinbaseFeed:
             if time_ms is None:
                 return
 
-            # Update latest price (atomic float assignment, thread-safe)
-            self._latest_price = price
+            # Update latest price (atomic tuple assignment, thread-safe)
+            self.latest_tick = (price, time.monotonic_ns())
 
-            # Add to rolling window
-            self.window.add(time_ms, price)
+            # Add to rolling window (returns the window's pct change)
+            pct_change = self.window.add(time_ms, price)
 
-            # Check for volatility signal
-            self._check_signal(time_ms)
+            # Check for volatility signal (None while < 2 ticks in window)
+            if pct_change is not None and not self.is_paused:
+                self._check_signal(time_ms, pct_change)
 
-        except (ValueError, TypeError):
+        except (KeyError, ValueError, TypeError):
             pass
 
     def _parse_timestamp(self, time_str: str) -> Optional[float]:
-        """Parse ISO timestamp to milliseconds since epoch."""
+        """Parse ISO timestamp to milliseconds since epoch.
+
+        Coinbase always sends "YYYY-MM-DDTHH:MM:SS[.ffffff]Z", so fields are
+        read at fixed offsets with integer math instead of strptime. The
+        midnight epoch for each date is computed once and cached.
+        """
         try:
-            from datetime import datetime, timezone
+            if len(time_str) < 20 or time_str[-1] != "Z" or time_str[10] != "T":
+                return None
+
+            day_base = _DAY_EPOCH_CACHE.get(time_str[:10])
+            if day_base is None:
+                day_base = calendar.timegm(
+                    (int(time_str[0:4]), int(time_str[5:7]), int(time_str[8:10]), 0, 0, 0, 0, 0, 0)
+                )
+                _DAY_EPOCH_CACHE[time_str[:10]] = day_base
+
+            seconds = (
+                day_base
+                + int(time_str[11:13]) * 3600
+                + int(time_str[14:16]) * 60
+                + int(time_str[17:19])
+            )
 
             # Handle both formats: with and without microseconds
-            if "." in time_str:
-                # Truncate to 6 decimal places if longer
-                parts = time_str.replace("Z", "").split(".")
-                if len(parts[1]) > 6:
-                    parts[1] = parts[1][:6]
-                time_str = f"{parts[0]}.{parts[1]}Z"
-                dt = datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S.%fZ")
-            else:
-                dt = datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%SZ")
+            micros = 0
+            if time_str[19] == ".":
+                # Truncate to 6 decimal places if longer, pad if shorter
+                micros = int(time_str[20:-1][:6].ljust(6, "0"))
+            elif len(time_str) != 20:
+                return None
 
-            dt = dt.replace(tzinfo=timezone.utc)
-            return dt.timestamp() * 1000
+            return (seconds * 1_000_000 + micros) / 1000
 
         except (ValueError, TypeError):
             return None
 
-    def _check_signal(self, current_time_ms: float):
-        """Check if volatility threshold crossed and dispatch signal directly."""
-        if self._paused:
-            return
-
-        pct_change = self.window.get_pct_change()
-        if pct_change is None:
-            return
+    def _check_signal(self, current_time_ms: float, pct_change: float):
+        """Check if volatility threshold crossed and dispatch signal directly.
 
+        Caller skips this while paused or when the window has < 2 ticks.
+        """
         # Check threshold
         if abs(pct_change) < self.threshold:
             return
@@ -264,12 +402,15 @@ class CoinbaseFeed:
         self._last_signal_time = current_time_ms
 
         # Stash window snapshot for data logging (rolling window ticks)
-        self._last_signal_data = {
-            "pct_change": pct_change,
-            "direction": direction,
-            "window_ticks": [{"time_ms": t, "price": p} for t, p in self.window._data],
-            "signal_time_ms": current_time_ms,
-        }
+        if not self._snapshot_enabled:
+            self._last_signal_data = None
+        else:
+            self._last_signal_data = {
+                "pct_change": pct_change,
+                "direction": direction,
+                "window_ticks": WindowSnapshot(*self.window.ticks_arrays()),
+                "signal_time_ms": current_time_ms,
+            }
 
         loop = asyncio.get_running_loop()
         loop.create_task(self._fire_signal(direction))
@@ -277,8 +418,9 @@ class CoinbaseFeed:
     async def _fire_signal(self, direction: str):
         """Fire signal callback directly (no queue indirection)."""
         try:
-            result = self.on_signal(direction)
-            if asyncio.iscoroutine(result):
-                await result
+            if self._on_signal_is_async:
+                await self.on_signal(direction)
+            else:
+                self.on_signal(direction)
         except Exception:
             pass  # Don't let callback errors propagate
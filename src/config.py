@@ -2,7 +2,11 @@
 
 import json
 import os
+from functools import cached_property
 from pathlib import Path
+from typing import Optional
+
+import orjson
 from dotenv import load_dotenv
 
 
@@ -54,8 +58,7 @@ def load_trading_params() -> dict:
     if not config_path.exists():
         raise FileNotFoundError(f"Trading config not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        params = json.load(f)
+    params = orjson.loads(config_path.read_bytes())
 
     required_params = ["position_size", "take_profit_pct", "stop_loss_pct"]
     for param in required_params:
@@ -75,8 +78,7 @@ def load_market_map() -> dict:
             "Run 'python run_mapper.py' first to generate it."
         )
 
-    with open(map_path, "r") as f:
-        market_map = json.load(f)
+    market_map = orjson.loads(map_path.read_bytes())
 
     required_fields = ["up_token_id", "down_token_id", "event_title"]
     for field in required_fields:
@@ -94,100 +96,105 @@ def save_market_map(market_map: dict) -> None:
         json.dump(market_map, f, indent=2)
 
 
-class Config:
-    """Unified configuration object."""
+API_CREDS_CACHE_PATH = PROJECT_ROOT / ".api_creds.json"
 
-    def __init__(self):
-        self.env = load_env_config()
-        self.params = load_trading_params()
-        self.market = None  # Loaded separately when needed
 
-    def load_market(self):
-        """Load market mapping."""
-        self.market = load_market_map()
-
-    @property
-    def api_key(self) -> str:
-        return self.env["polymarket_api_key"]
-
-    @property
-    def api_secret(self) -> str:
-        return self.env["polymarket_api_secret"]
-
-    @property
-    def passphrase(self) -> str:
-        return self.env["polymarket_passphrase"]
+def load_cached_api_creds(signer_address: str) -> Optional[dict]:
+    """Load API credentials previously derived for this signer address."""
+    try:
+        with open(API_CREDS_CACHE_PATH, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
 
-    @property
-    def funder_address(self) -> str:
-        return self.env["funder_address"]
+    if cached.get("signer_address", "").lower() != signer_address.lower():
+        return None
+    creds = cached.get("creds") or {}
+    if not all(creds.get(k) for k in ("api_key", "api_secret", "api_passphrase")):
+        return None
+    return creds
 
-    @property
-    def private_key(self) -> str:
-        return self.env["private_key"]
 
-    @property
-    def position_size(self) -> float:
-        return self.params["position_size"]
+def save_cached_api_creds(signer_address: str, creds: dict) -> None:
+    """Persist derived API credentials (owner-only permissions)."""
+    fd = os.open(API_CREDS_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump({"signer_address": signer_address, "creds": creds}, f, indent=2)
 
-    @property
-    def take_profit_pct(self) -> float:
-        return self.params["take_profit_pct"]
 
-    @property
-    def stop_loss_pct(self) -> float:
-        return self.params["stop_loss_pct"]
+def clear_cached_api_creds() -> None:
+    """Delete cached API credentials (e.g. after the server rejects them)."""
+    try:
+        os.remove(API_CREDS_CACHE_PATH)
+    except FileNotFoundError:
+        pass
 
-    @property
-    def trigger_threshold(self) -> float:
-        return self.params.get("trigger_threshold", 0.00015)
 
-    @property
-    def signal_cooldown_ms(self) -> int:
-        return self.params.get("signal_cooldown_ms", 2000)
-
-    @property
-    def volatility_window_ms(self) -> int:
-        return self.params.get("volatility_window_ms", 500)
-
-    @property
-    def max_spread_cents(self) -> int:
-        return self.params.get("max_spread_cents", 1)
+class Config:
+    """Unified configuration object.
 
-    @property
-    def stale_position_sec(self) -> float:
-        """Seconds after which a position is considered stale (activates trailing stop)."""
-        return self.params.get("stale_position_sec", 5.0)
+    Values are resolved once at load time and stored as plain attributes,
+    since the trading hot path reads them on every signal.
+    """
 
-    @property
-    def price_cache_stale_ms(self) -> int:
-        """Milliseconds after which cached prices are considered stale."""
-        return self.params.get("price_cache_stale_ms", 5000)
+    def __init__(self):
+        self.env = load_env_config()
+        self.params = load_trading_params()
+        self.market = None  # Loaded separately when needed
 
-    @property
-    def slippage_cents(self) -> int:
-        """Cents of slippage tolerance for FAK order fill reliability."""
-        return self.params.get("slippage_cents", 2)
+        env = self.env
+        self.api_key: str = env["polymarket_api_key"]
+        self.api_secret: str = env["polymarket_api_secret"]
+        self.passphrase: str = env["polymarket_passphrase"]
+        self.funder_address: str = env["funder_address"]
+        self.private_key: str = env["private_key"]
+
+        params = self.params
+        self.position_size: float = params["position_size"]
+        self.take_profit_pct: float = params["take_profit_pct"]
+        self.stop_loss_pct: float = params["stop_loss_pct"]
+        self.trigger_threshold: float = params.get("trigger_threshold", 0.00015)
+        self.signal_cooldown_ms: int = params.get("signal_cooldown_ms", 2000)
+        self.volatility_window_ms: int = params.get("volatility_window_ms", 500)
+        self.max_spread_cents: int = params.get("max_spread_cents", 1)
+        # Seconds after which a position is considered stale (activates trailing stop)
+        self.stale_position_sec: float = params.get("stale_position_sec", 5.0)
+        # Milliseconds after which cached prices are considered stale
+        self.price_cache_stale_ms: int = params.get("price_cache_stale_ms", 5000)
+        # Cents of slippage tolerance for FAK order fill reliability
+        self.slippage_cents: int = params.get("slippage_cents", 2)
+        # Milliseconds to skip signals after a Polymarket WS reconnect
+        self.reconnect_cooldown_ms: int = params.get("reconnect_cooldown_ms", 5000)
+        # Worker threads for exit orders (TP/SL/stale/manual run concurrently)
+        self.max_concurrent_exits: int = params.get("max_concurrent_exits", 4)
+        # Print [DEBUG] diagnostics (e.g. entry price source and cache age)
+        self.debug: bool = params.get("debug", False)
 
-    @property
-    def reconnect_cooldown_ms(self) -> int:
-        """Milliseconds to skip signals after a Polymarket WS reconnect."""
-        return self.params.get("reconnect_cooldown_ms", 5000)
+    def load_market(self):
+        """Load market mapping."""
+        self.market = load_market_map()
+        # Drop values cached from a previously loaded market
+        for name in ("up_token_id", "down_token_id", "event_title", "token_by_direction"):
+            self.__dict__.pop(name, None)
 
-    @property
-    def up_token_id(self) -> str:
+    def _market_field(self, name: str) -> str:
         if not self.market:
             raise ValueError("Market not loaded. Call load_market() first.")
-        return self.market["up_token_id"]
+        return self.market[name]
 
-    @property
+    @cached_property
+    def up_token_id(self) -> str:
+        return self._market_field("up_token_id")
+
+    @cached_property
     def down_token_id(self) -> str:
-        if not self.market:
-            raise ValueError("Market not loaded. Call load_market() first.")
-        return self.market["down_token_id"]
+        return self._market_field("down_token_id")
 
-    @property
+    @cached_property
     def event_title(self) -> str:
-        if not self.market:
-            raise ValueError("Market not loaded. Call load_market() first.")
-        return self.market["event_title"]
+        return self._market_field("event_title")
+
+    @cached_property
+    def token_by_direction(self) -> dict[str, str]:
+        """Signal direction ("UP"/"DOWN") -> token ID."""
+        return {"UP": self.up_token_id, "DOWN": self.down_token_id}
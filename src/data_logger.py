@@ -1,6 +1,6 @@
 """Async JSONL data logger for trading bot events."""
 
-import json
+import os
 import queue
 import threading
 import time
@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .config import PROJECT_ROOT
 
 
@@ -18,6 +20,8 @@ class DataLogger:
     """
 
     _SENTINEL = None  # object() would be better but None is fine for "stop"
+    _MAX_BATCH = 128  # Max events serialized into a single write() call
+    _MAX_QUEUE = 10_000  # Bound queued events; overflow is dropped and counted
 
     def __init__(self):
         now = datetime.now(timezone.utc)
@@ -26,53 +30,101 @@ class DataLogger:
         self._data_dir = PROJECT_ROOT / "data" / date_str
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._file_path = self._data_dir / f"run-{time_str}.jsonl"
-        self._file = open(self._file_path, "a", encoding="utf-8")
-        self._queue: queue.Queue[dict | None] = queue.Queue()
+        # Raw append-only fd: batches are already bytes, so skip buffered I/O
+        self._fd = os.open(self._file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._queue: queue.Queue[dict | None] = queue.Queue(maxsize=self._MAX_QUEUE)
+        self._dropped = 0
+        self._reported_dropped = 0
+        # (epoch second, "YYYY-MM-DDTHH:MM:SS") for the current UTC second.
+        # Swapped as one tuple since the writer thread also stamps events.
+        self._sec_prefix: tuple[int, str] = (0, "")
         self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
         self._writer_thread.start()
 
     def log(self, event: dict[str, Any]) -> None:
         """Queue an event for async write. Never blocks."""
         event = dict(event)
-        event["ts"] = datetime.now(timezone.utc).isoformat()
+        event["ts"] = self._timestamp()
         try:
             self._queue.put_nowait(event)
         except queue.Full:
-            pass  # Silently drop if queue ever fills
+            self._dropped += 1
+
+    def _timestamp(self) -> str:
+        """UTC ISO-8601 timestamp; the seconds prefix is reformatted once per second."""
+        ns = time.time_ns()
+        sec = ns // 1_000_000_000
+        cached_sec, prefix = self._sec_prefix
+        if sec != cached_sec:
+            prefix = datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            self._sec_prefix = (sec, prefix)
+        return f"{prefix}.{(ns % 1_000_000_000) // 1000:06d}+00:00"
+
+    @property
+    def dropped(self) -> int:
+        """Number of events dropped because the queue was full."""
+        return self._dropped
 
     def close(self) -> None:
         """Drain queue, write remaining events, stop writer thread."""
         self._queue.put(self._SENTINEL)
         self._writer_thread.join(timeout=5.0)
-        self._file.close()
+        os.close(self._fd)
 
     def _writer_loop(self) -> None:
-        """Background thread: consume queue and append JSON lines to file."""
+        """Background thread: consume queue and append JSON lines to file.
+
+        Blocks for the first event, then drains whatever else is already
+        queued (up to _MAX_BATCH) and writes the batch with one os.write.
+        """
         while True:
             try:
                 event = self._queue.get(timeout=0.1)
             except queue.Empty:
                 continue
 
-            if event is self._SENTINEL:
-                # Drain remaining events before exiting
-                while True:
-                    try:
-                        ev = self._queue.get_nowait()
-                        if ev is not self._SENTINEL:
-                            self._write_line(ev)
-                    except queue.Empty:
+            batch = []
+            stopping = False
+            while True:
+                if event is self._SENTINEL:
+                    # Drain remaining events before exiting
+                    stopping = True
+                else:
+                    batch.append(event)
+                    if len(batch) >= self._MAX_BATCH and not stopping:
                         break
-                return
+                try:
+                    event = self._queue.get_nowait()
+                except queue.Empty:
+                    break
 
-            self._write_line(event)
+            dropped = self._dropped
+            if dropped != self._reported_dropped:
+                self._reported_dropped = dropped
+                batch.append(
+                    {"event": "logger_drop", "count": dropped, "ts": self._timestamp()}
+                )
+            self._write_lines(batch)
+            if stopping:
+                return
 
-    def _write_line(self, event: dict[str, Any]) -> None:
-        """Write one JSON line. Silently ignore errors."""
+    def _write_lines(self, events: list[dict[str, Any]]) -> None:
+        """Write a batch of JSON lines. Silently skip unserializable events."""
+        buf = bytearray()
+        for event in events:
+            try:
+                buf += orjson.dumps(event, default=_json_default)
+                buf += b"\n"
+            except Exception:
+                pass
+        if not buf:
+            return
+        view = memoryview(buf)
         try:
-            line = json.dumps(event, default=_json_default) + "\n"
-            self._file.write(line)
-            self._file.flush()
+            while view:
+                # os.write may be partial; EINTR is retried by Python (PEP 475)
+                written = os.write(self._fd, view)
+                view = view[written:]
         except Exception:
             pass
 
@@ -81,4 +133,12 @@ def _json_default(obj: Any) -> Any:
     """JSON serializer for non-serializable objects."""
     if isinstance(obj, datetime):
         return obj.isoformat()
+    # Lazily materialized payloads (e.g. coinbase_feed.WindowSnapshot)
+    to_json = getattr(obj, "to_json", None)
+    if to_json is not None:
+        return to_json()
+    # NamedTuples (e.g. main.SpreadSnapshot) log as objects, not arrays
+    as_dict = getattr(obj, "_asdict", None)
+    if as_dict is not None:
+        return as_dict()
     raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
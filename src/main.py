@@ -1,17 +1,27 @@
 """Main terminal UI and keyboard handler for Polymarket trading bot."""
 
 import asyncio
+import os
+import queue
+import select
 import sys
 import termios
 import threading
 import time
 import tty
-from datetime import datetime, timezone
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, NamedTuple, Optional
 
-from termcolor import colored
+import orjson
 
+try:
+    import uvloop  # libuv-based event loop: faster websocket recv + task switching
+except ImportError:  # Optional; falls back to the stdlib asyncio loop
+    uvloop = None
+
+from .ansi import paint
 from .clob_client import FastClobClient
+from .clock import now_hms
 from .coinbase_feed import CoinbaseFeed
 from .config import Config
 from .data_logger import DataLogger
@@ -19,7 +29,28 @@ from .order_executor import OrderExecutor
 from .position_manager import ExitReason, Position, PositionManager, PositionStatus
 from .price_cache import PriceCache
 from .signal_controller import SignalController
-from .websocket_client import PriceStream
+from .websocket_client import PriceStream, UserStream
+
+
+class SpreadSnapshot(NamedTuple):
+    """Polymarket bid/ask/spread at signal time (logged as a JSON object)."""
+
+    token_id: str
+    best_bid: float
+    best_ask: float
+    spread_cents: int
+
+
+# Pre-rendered feed/auto-signal status line, keyed by (connected, enabled)
+_STATUS_LINES = {
+    (connected, enabled): paint(
+        f"           Coinbase: {'connected' if connected else 'disconnected'} | "
+        f"Auto-signals: {'active' if enabled else 'PAUSED'}",
+        "green" if (connected and enabled) else "yellow",
+    ) + "\n"
+    for connected in (True, False)
+    for enabled in (True, False)
+}
 
 
 class TradingBot:
@@ -31,6 +62,7 @@ class TradingBot:
         self.position_manager: Optional[PositionManager] = None
         self.order_executor: Optional[OrderExecutor] = None
         self.price_stream: Optional[PriceStream] = None
+        self.user_stream: Optional[UserStream] = None
         self.coinbase_feed: Optional[CoinbaseFeed] = None
         self.signal_controller: Optional[SignalController] = None
         self.data_logger = DataLogger()
@@ -40,18 +72,38 @@ class TradingBot:
         self._in_exit_menu = False
         self._exit_menu_positions: list[Position] = []
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reader_thread: Optional[threading.Thread] = None
+        self._session_config: Optional[orjson.Fragment] = None
         self._last_polymarket_reconnect_ms: float = 0
+        # Entries run one at a time on their own thread, off the shared default pool
+        self._order_io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="order-io")
+
+        # Runtime console output goes through one writer thread, so a slow or
+        # paused terminal never blocks the event loop or the order threads
+        self._out_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._out_thread = threading.Thread(target=self._stdout_writer, daemon=True)
+        self._out_thread.start()
+
+        # Keystroke -> handler (exit-menu input is routed separately)
+        self._key_handlers: dict[str, Callable[[], object]] = {
+            "u": lambda: asyncio.run_coroutine_threadsafe(self._place_entry_async("UP"), self._loop),
+            "d": lambda: asyncio.run_coroutine_threadsafe(self._place_entry_async("DOWN"), self._loop),
+            "k": self._toggle_auto_signals,
+            "x": self._show_exit_menu,
+            "q": self._shutdown,
+            "s": self._show_status,
+        }
 
     def initialize(self):
         """Initialize all components."""
-        print(colored("Initializing trading bot...", "cyan"))
+        print(paint("Initializing trading bot...", "cyan"))
 
         # Load configuration
         try:
             self.config = Config()
             self.config.load_market()
         except Exception as e:
-            print(colored(f"Configuration error: {e}", "red"))
+            print(paint(f"Configuration error: {e}", "red"))
             sys.exit(1)
 
         print(f"  Market: {self.config.event_title}")
@@ -62,9 +114,10 @@ class TradingBot:
         # Initialize CLOB client
         try:
             self.clob_client = FastClobClient(self.config)
-            self.clob_client.warm_up()  # Pre-establish HTTP/2 connection
+            # Pre-establish HTTP/2 connection while the rest of init proceeds
+            threading.Thread(target=self.clob_client.warm_up, daemon=True).start()
         except Exception as e:
-            print(colored(f"CLOB client error: {e}", "red"))
+            print(paint(f"CLOB client error: {e}", "red"))
             sys.exit(1)
 
         # Initialize price cache (WebSocket keeps it fresh; used by executor, signal controller, and position manager)
@@ -89,7 +142,7 @@ class TradingBot:
         )
 
         # Initialize price stream
-        token_ids = [self.config.up_token_id, self.config.down_token_id]
+        token_ids = (self.config.up_token_id, self.config.down_token_id)
         self.price_stream = PriceStream(
             token_ids,
             on_price_update=self._on_price_update,
@@ -97,6 +150,15 @@ class TradingBot:
             on_disconnect=self._on_ws_disconnect,
             price_cache=self.price_cache,
             data_logger=self.data_logger,
+            debug=self.config.debug,
+        )
+
+        # Initialize user stream (pushes our fills so orders skip REST polling)
+        self.user_stream = UserStream(
+            self.clob_client.client.creds,
+            on_fill=self.clob_client.record_fill,
+            on_state_change=self._on_user_stream_state,
+            data_logger=self.data_logger,
         )
 
         # Initialize signal controller
@@ -117,6 +179,7 @@ class TradingBot:
             on_connect=self._on_coinbase_connect,
             on_disconnect=self._on_coinbase_disconnect,
             data_logger=self.data_logger,
+            snapshot=self.data_logger is not None,  # signal events log window_ticks
         )
 
         # Wire CoinbaseFeed reference to OrderExecutor for btc_price logging
@@ -127,21 +190,25 @@ class TradingBot:
         print(f"  Volatility window: {self.config.volatility_window_ms}ms")
         print(f"  Max spread: {self.config.max_spread_cents}c")
 
+        # Config is fixed for the run: serialize it once and embed the
+        # pre-encoded bytes in both session_start and session_end
+        self._session_config = orjson.Fragment(orjson.dumps({
+            "position_size": self.config.position_size,
+            "take_profit_pct": self.config.take_profit_pct,
+            "stop_loss_pct": self.config.stop_loss_pct,
+            "trigger_threshold": self.config.trigger_threshold,
+            "signal_cooldown_ms": self.config.signal_cooldown_ms,
+            "volatility_window_ms": self.config.volatility_window_ms,
+            "max_spread_cents": self.config.max_spread_cents,
+            "stale_position_sec": self.config.stale_position_sec,
+            "price_cache_stale_ms": self.config.price_cache_stale_ms,
+            "reconnect_cooldown_ms": self.config.reconnect_cooldown_ms,
+        }))
+
         # Log session start for data capture
         self.data_logger.log({
             "type": "session_start",
-            "config": {
-                "position_size": self.config.position_size,
-                "take_profit_pct": self.config.take_profit_pct,
-                "stop_loss_pct": self.config.stop_loss_pct,
-                "trigger_threshold": self.config.trigger_threshold,
-                "signal_cooldown_ms": self.config.signal_cooldown_ms,
-                "volatility_window_ms": self.config.volatility_window_ms,
-                "max_spread_cents": self.config.max_spread_cents,
-                "stale_position_sec": self.config.stale_position_sec,
-                "price_cache_stale_ms": self.config.price_cache_stale_ms,
-                "reconnect_cooldown_ms": self.config.reconnect_cooldown_ms,
-            },
+            "config": self._session_config,
             "market": {
                 "event_title": self.config.event_title,
                 "up_token_id": self.config.up_token_id,
@@ -149,51 +216,58 @@ class TradingBot:
             },
         })
 
-        print(colored("Initialization complete.", "green"))
+        print(paint("Initialization complete.", "green"))
 
-    def _get_spread_snapshot(self, token_id: str) -> dict | None:
+    def _get_spread_snapshot(self, token_id: str) -> Optional[SpreadSnapshot]:
         """Get Polymarket bid/ask/spread for logging."""
         if not self.price_cache:
             return None
         snapshot = self.price_cache.get(token_id)
-        if not snapshot or snapshot.best_bid is None or snapshot.best_ask is None:
+        if not snapshot:
             return None
-        spread_cents = round((snapshot.best_ask - snapshot.best_bid) * 100) if snapshot.best_bid > 0 else None
-        return {
-            "token_id": token_id,
-            "best_bid": snapshot.best_bid,
-            "best_ask": snapshot.best_ask,
-            "spread_cents": spread_cents,
-        }
+        best_bid = snapshot.best_bid
+        best_ask = snapshot.best_ask
+        if best_bid is None or best_ask is None:
+            return None
+        # PriceStream only caches positive prices, so no zero-bid guard needed
+        return SpreadSnapshot(token_id, best_bid, best_ask, round((best_ask - best_bid) * 100))
 
     def _on_price_update(self, token_id: str, best_bid: float, best_ask: float):
-        """Handle price update from WebSocket (silent - only triggers TP/SL checks)."""
-        if best_bid is not None:
-            self.position_manager.check_exit_conditions(token_id, best_bid)
+        """Handle price update from WebSocket (silent - TP/SL checks and entry pre-signing)."""
+        self.order_executor.presign_entry(token_id, best_ask)
+
+        # Idle tokens (no OPEN/CLOSING position) skip the exit check entirely
+        pm = self.position_manager
+        if best_bid is not None and pm.has_active_position(token_id):
+            pm.check_exit_conditions(token_id, best_bid)
+
+    def _on_user_stream_state(self, connected: bool):
+        """Enable WebSocket fill detection only while the user stream is up."""
+        self.clob_client.ws_fills_active = connected
 
     def _on_ws_connect(self):
         """Handle WebSocket connection."""
         self._last_polymarket_reconnect_ms = time.monotonic() * 1000
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(colored(f"[{timestamp}] WebSocket connected", "green"))
+        timestamp = now_hms()
+        self._emit(paint(f"[{timestamp}] WebSocket connected", "green"))
 
     def _on_ws_disconnect(self):
         """Handle WebSocket disconnection."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(colored(f"[{timestamp}] WebSocket disconnected, reconnecting...", "yellow"))
+        timestamp = now_hms()
+        self._emit(paint(f"[{timestamp}] WebSocket disconnected, reconnecting...", "yellow"))
 
     async def _on_coinbase_signal(self, direction: str):
         """Handle volatility signal from Coinbase feed."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(colored(f"[{timestamp}] AUTO-SIGNAL: {direction}", "magenta"))
+        cfg = self.config
+        pm = self.position_manager
+        sc = self.signal_controller
+        timestamp = now_hms()
+        self._emit(paint(f"[{timestamp}] AUTO-SIGNAL: {direction}", "magenta"))
 
-        token_id = (
-            self.config.up_token_id if direction == "UP"
-            else self.config.down_token_id
-        )
+        token_id = cfg.token_by_direction[direction]
 
         # Get signal data and Polymarket spread snapshot for logging
-        signal_data = getattr(self.coinbase_feed, "_last_signal_data", None)
+        signal_data = self.coinbase_feed._last_signal_data
         spread_snapshot = self._get_spread_snapshot(token_id)
 
         # Check reconnect cooldown (stale cache guard)
@@ -206,19 +280,19 @@ class TradingBot:
 
         # Determine outcome
         outcome = "executed"
-        if not self.signal_controller.is_enabled:
+        if not sc.is_enabled:
             outcome = "skipped_disabled"
-            print(colored(f"[{timestamp}] Skipped: auto-signals disabled", "yellow"))
-        elif reconnect_ago_ms is not None and reconnect_ago_ms < self.config.reconnect_cooldown_ms:
+            self._emit(paint(f"[{timestamp}] Skipped: auto-signals disabled", "yellow"))
+        elif reconnect_ago_ms is not None and reconnect_ago_ms < cfg.reconnect_cooldown_ms:
             outcome = "skipped_reconnect_cooldown"
-            print(colored(f"[{timestamp}] Skipped: WS reconnect {reconnect_ago_ms:.0f}ms ago (cooldown {self.config.reconnect_cooldown_ms}ms)", "yellow"))
-        elif self.position_manager.has_active_position(token_id):
+            self._emit(paint(f"[{timestamp}] Skipped: WS reconnect {reconnect_ago_ms:.0f}ms ago (cooldown {cfg.reconnect_cooldown_ms}ms)", "yellow"))
+        elif pm.has_active_position(token_id):
             outcome = "skipped_position_active"
-            print(colored(f"[{timestamp}] Skipped: position already active", "yellow"))
+            self._emit(paint(f"[{timestamp}] Skipped: position already active", "yellow"))
             # Log concurrent_position_warning if a CLOSING position blocked this signal
             closing_pos = next(
-                (pos for pos in self.position_manager.positions.values()
-                 if pos.token_id == token_id and pos.status == PositionStatus.CLOSING),
+                (pos for pos in pm.active_positions(token_id)
+                 if pos.status == PositionStatus.CLOSING),
                 None,
             )
             if closing_pos:
@@ -228,9 +302,9 @@ class TradingBot:
                     "closing_position_id": closing_pos.id,
                     "signal_direction": direction,
                 })
-        elif not self.signal_controller._check_spread(token_id):
+        elif not sc._check_spread(token_id):
             outcome = "skipped_spread_wide"
-            print(colored(f"[{timestamp}] Skipped: spread too wide", "yellow"))
+            self._emit(paint(f"[{timestamp}] Skipped: spread too wide", "yellow"))
 
         # Log signal event (always, including skipped)
         self.data_logger.log({
@@ -238,7 +312,7 @@ class TradingBot:
             "direction": direction,
             "outcome": outcome,
             "pct_change": signal_data["pct_change"] if signal_data else None,
-            "threshold": self.config.trigger_threshold,
+            "threshold": cfg.trigger_threshold,
             "window_ticks": signal_data["window_ticks"] if signal_data else [],
             "signal_time_ms": signal_data["signal_time_ms"] if signal_data else None,
             "polymarket_spread": spread_snapshot,
@@ -249,40 +323,35 @@ class TradingBot:
             return
 
         # Execute entry in thread executor (non-blocking for event loop)
-        loop = self._loop or asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, self.order_executor.execute_entry, direction
-        )
-        output = self.order_executor.format_entry_result(result)
-        print(output)
+        result = await self._submit(self._order_io_pool, self._execute_entry, direction)
+        self.order_executor.format_entry_result(result, self._emit)
 
     def _on_coinbase_connect(self):
         """Handle Coinbase WebSocket connection."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(colored(f"[{timestamp}] Coinbase feed connected", "green"))
+        timestamp = now_hms()
+        self._emit(paint(f"[{timestamp}] Coinbase feed connected", "green"))
 
     def _on_coinbase_disconnect(self):
         """Handle Coinbase WebSocket disconnection."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(colored(f"[{timestamp}] Coinbase feed disconnected, reconnecting...", "yellow"))
+        timestamp = now_hms()
+        self._emit(paint(f"[{timestamp}] Coinbase feed disconnected, reconnecting...", "yellow"))
 
     def _toggle_auto_signals(self):
         """Toggle automatic signal handling (kill switch)."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
+        timestamp = now_hms()
 
         if self.signal_controller.is_enabled:
             self.signal_controller.disable_auto()
             self.coinbase_feed.pause()
-            print(colored(f"[{timestamp}] Auto-signals PAUSED (manual u/d still works)", "yellow"))
+            self._emit(paint(f"[{timestamp}] Auto-signals PAUSED (manual u/d still works)", "yellow"))
         else:
             self.signal_controller.enable_auto()
             self.coinbase_feed.resume()
-            print(colored(f"[{timestamp}] Auto-signals RESUMED", "green"))
+            self._emit(paint(f"[{timestamp}] Auto-signals RESUMED", "green"))
 
     def _on_exit_complete(self, position: Position, reason: ExitReason):
         """Handle position exit completion."""
-        output = self.order_executor.format_exit_result(position, reason.value)
-        print(output)
+        self.order_executor.format_exit_result(position, reason.value, self._emit)
 
     def _on_key_press(self, char: str):
         """Handle keyboard input."""
@@ -293,131 +362,161 @@ class TradingBot:
             self._handle_exit_menu_input(char)
             return
 
-        if char == "u":
-            asyncio.run_coroutine_threadsafe(
-                self._place_entry_async("UP"),
-                self._loop,
-            )
-        elif char == "d":
-            asyncio.run_coroutine_threadsafe(
-                self._place_entry_async("DOWN"),
-                self._loop,
-            )
-        elif char == "k":
-            self._toggle_auto_signals()
-        elif char == "x":
-            self._show_exit_menu()
-        elif char == "q":
-            self._shutdown()
-        elif char == "s":
-            self._show_status()
+        handler = self._key_handlers.get(char)
+        if handler is not None:
+            handler()
 
     def _handle_exit_menu_input(self, char: str):
         """Handle input while in exit menu."""
         if char == "0":
             self._in_exit_menu = False
             self._exit_menu_positions = []
-            print("Cancelled.")
+            self._emit("Cancelled.")
             return
 
+        # Menu keys are single ASCII digits; anything else is ignored
+        if not ("1" <= char <= "9"):
+            return
+
+        selection = ord(char) - 48
+        if 1 <= selection <= len(self._exit_menu_positions):
+            position = self._exit_menu_positions[selection - 1]
+            self._in_exit_menu = False
+            self._exit_menu_positions = []
+
+            self._emit(f"Closing position {position.id}...")
+            # Don't block the keyboard thread; report failure if the exit
+            # couldn't be queued
+            future = asyncio.run_coroutine_threadsafe(
+                self.order_executor.execute_exit(position.id),
+                self._loop,
+            )
+            future.add_done_callback(self._on_manual_exit_done)
+        else:
+            self._emit(paint(f"Invalid selection: {selection}", "yellow"))
+
+    def _on_manual_exit_done(self, future):
+        """Report a manual exit that could not be initiated."""
         try:
-            selection = int(char)
-            if 1 <= selection <= len(self._exit_menu_positions):
-                position = self._exit_menu_positions[selection - 1]
-                self._in_exit_menu = False
-                self._exit_menu_positions = []
-
-                print(f"Closing position {position.id}...")
-                future = asyncio.run_coroutine_threadsafe(
-                    self.order_executor.execute_exit(position.id),
-                    self._loop,
-                )
-                try:
-                    if not future.result(timeout=30):
-                        print(colored("Failed to initiate exit", "red"))
-                except Exception:
-                    print(colored("Failed to initiate exit", "red"))
-            else:
-                print(colored(f"Invalid selection: {selection}", "yellow"))
-        except ValueError:
-            pass
+            ok = future.result()
+        except Exception:
+            ok = False
+        if not ok:
+            self._emit(paint("Failed to initiate exit", "red"))
 
     async def _place_entry_async(self, direction: str):
         """Place an entry order (runs on event loop, entry I/O in executor)."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(f"[{timestamp}] Placing Buy {direction} order...")
+        timestamp = now_hms()
+        self._emit(f"[{timestamp}] Placing Buy {direction} order...")
 
-        loop = self._loop or asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            None, self.order_executor.execute_entry, direction
-        )
-        output = self.order_executor.format_entry_result(result)
-        print(output)
+        result = await self._submit(self._order_io_pool, self._execute_entry, direction)
+        self.order_executor.format_entry_result(result, self._emit)
 
     def _show_exit_menu(self):
         """Display numbered menu of open positions for manual exit."""
         positions = self.position_manager.list_open_positions()
 
         if not positions:
-            print(colored("No open positions to exit", "yellow"))
+            self._emit(paint("No open positions to exit", "yellow"))
             return
 
         self._in_exit_menu = True
         self._exit_menu_positions = positions
 
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(f"\n[{timestamp}] --- Open Positions ---")
+        timestamp = now_hms()
+        out = [f"\n[{timestamp}] --- Open Positions ---\n"]
 
-        for i, pos in enumerate(positions, 1):
-            summary = self.position_manager.get_position_summary(pos)
-            print(f"  {i}. [{pos.id}] {summary}")
+        summaries = self.position_manager.summarize_many(positions)
+        for i, (pos, summary) in enumerate(zip(positions, summaries), 1):
+            out.append(f"  {i}. [{pos.id}] {summary}\n")
 
-        print("  0. Cancel")
-        print("Enter position number to exit: ", end="", flush=True)
+        out.append("  0. Cancel\n")
+        out.append("Enter position number to exit: ")
+        # One write so the menu isn't interleaved with feed output
+        self._emit("".join(out), end="")
 
     def _show_status(self):
         """Show current status and positions."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
+        timestamp = now_hms()
         positions = self.position_manager.list_open_positions()
 
-        print(f"\n[{timestamp}] Status")
+        out = [f"\n[{timestamp}] Status\n"]
 
         # Show Coinbase feed state
         cb_connected = self.coinbase_feed.is_connected if self.coinbase_feed else False
-        cb_paused = self.coinbase_feed.is_paused if self.coinbase_feed else True
         auto_enabled = self.signal_controller.is_enabled if self.signal_controller else False
+        out.append(_STATUS_LINES[cb_connected, auto_enabled])
 
-        cb_status = "connected" if cb_connected else "disconnected"
-        auto_status = "PAUSED" if not auto_enabled else "active"
-        status_color = "green" if (cb_connected and auto_enabled) else "yellow"
-
-        print(colored(f"           Coinbase: {cb_status} | Auto-signals: {auto_status}", status_color))
-        
         # Show # of open positions
-        print(f"           Open positions: {len(positions)}")
+        out.append(f"           Open positions: {len(positions)}\n")
 
         # Trade stats
         stats = self.position_manager.get_trade_stats()
         wr_color = "green" if stats["win_rate"] >= 50 else "red"
-        print(f"           Trades: {stats['total']}  |  W: {stats['wins']}  L: {stats['losses']}  BE: {stats['breakevens']}")
-        print(colored(f"           Win rate: {stats['win_rate']:.1f}%", wr_color))
+        out.append(f"           Trades: {stats['total']}  |  W: {stats['wins']}  L: {stats['losses']}  BE: {stats['breakevens']}\n")
+        out.append(paint(f"           Win rate: {stats['win_rate']:.1f}%", wr_color) + "\n")
 
         # Show total P&L
         if positions:
+            # One concurrent book fetch per token, shared by P&L and summaries
+            bids = self.position_manager.get_best_bids(positions)
             total_unrealized = 0.0
             for pos in positions:
-                bid = self.clob_client.get_best_bid(pos.token_id)
+                bid = bids.get(pos.token_id)
                 if bid:
                     total_unrealized += pos.pnl(bid)
-                summary = self.position_manager.get_position_summary(pos)
-                print(f"    [{pos.id}] {summary}")
+            summaries = self.position_manager.summarize_many(positions, bids)
+            for pos, summary in zip(positions, summaries):
+                out.append(f"    [{pos.id}] {summary}\n")
             pnl_color = "green" if total_unrealized >= 0 else "red"
-            print(colored(f"           Unrealized P&L: ${total_unrealized:+.2f}", pnl_color))
+            out.append(paint(f"           Unrealized P&L: ${total_unrealized:+.2f}", pnl_color) + "\n")
 
         realized = self.position_manager.get_total_pnl()
         if realized != 0:
             pnl_color = "green" if realized >= 0 else "red"
-            print(colored(f"           Realized P&L: ${realized:+.2f}", pnl_color))
+            out.append(paint(f"           Realized P&L: ${realized:+.2f}", pnl_color) + "\n")
+
+        # One write so the status block isn't interleaved with feed output
+        self._emit("".join(out), end="")
+
+    # Burst window: output arriving within this many seconds of a write is
+    # coalesced into the next one
+    _OUTPUT_BATCH_SEC = 0.008
+
+    def _emit(self, text: str, end: str = "\n"):
+        """Queue console output (print() semantics, never blocks)."""
+        self._out_queue.put(text + end)
+
+    def _stdout_writer(self):
+        """Background thread: write queued output, coalescing bursts."""
+        out_queue = self._out_queue
+        while True:
+            chunk = out_queue.get()
+            stopping = chunk is None
+            buf = [] if stopping else [chunk]
+            while not stopping:
+                try:
+                    chunk = out_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if chunk is None:
+                    stopping = True
+                else:
+                    buf.append(chunk)
+            if buf:
+                try:
+                    sys.stdout.write("".join(buf))
+                    sys.stdout.flush()
+                except Exception:
+                    pass
+            if stopping:
+                return
+            time.sleep(self._OUTPUT_BATCH_SEC)
+
+    def _flush_output(self):
+        """Stop the output writer after it drains everything queued."""
+        self._out_queue.put(None)
+        self._out_thread.join(timeout=1.0)
 
     def _shutdown(self):
         """Shutdown the bot (idempotent)."""
@@ -425,25 +524,44 @@ class TradingBot:
             return
         self._shutdown_done = True
 
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(colored(f"\n[{timestamp}] Shutting down...", "yellow"))
+        timestamp = now_hms()
+        self._emit(paint(f"\n[{timestamp}] Shutting down...", "yellow"))
 
         self._running = False
         if self.price_stream:
             self.price_stream.stop()
+        if self.user_stream:
+            self.user_stream.stop()
         if self.coinbase_feed:
             self.coinbase_feed.stop()
-
-        # Log session end and close data logger
+        self._order_io_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _finalize(self):
+        """Wait for in-flight exits, then close the CLOB client, log session
+        end and close the data logger.
+
+        Runs after the event loop has returned: exits run on the position
+        manager's own threads and sell through the CLOB client, so it stays
+        open until they finish, and their fills and P&L records must land
+        before session_end is written and the logger closes.
+        """
+        # Queued entries were cancelled in _shutdown; let a running one finish
+        self._order_io_pool.shutdown(wait=True)
+        if self.position_manager:
+            self.position_manager.close()
+        if self.clob_client:
+            self.clob_client.close()
         if self.position_manager:
             realized = self.position_manager.get_total_pnl()
-            open_positions = self.position_manager.list_open_positions()
+            # CLOSING counts too: its exit never finished
+            open_positions = self.position_manager.list_active_positions()
             trade_count = len([p for p in self.position_manager.positions.values() if p.exit_reason is not None])
             self.data_logger.log({
                 "type": "session_end",
                 "total_realized_pnl": realized,
                 "trade_count": trade_count,
                 "open_positions_remaining": len(open_positions),
+                "config": self._session_config,
             })
         self.data_logger.close()
 
@@ -454,7 +572,15 @@ class TradingBot:
         try:
             tty.setcbreak(fd)
             while self._running:
-                ch = sys.stdin.read(1)
+                # Poll with a timeout so shutdown doesn't wait for a keystroke
+                ready, _, _ = select.select([fd], [], [], 0.1)
+                if not ready:
+                    continue
+                # os.read bypasses sys.stdin's buffer (which can hold keys back)
+                data = os.read(fd, 1)
+                if not data:
+                    break  # stdin closed
+                ch = data.decode(errors="ignore")
                 if ch:
                     self._on_key_press(ch)
         finally:
@@ -463,25 +589,30 @@ class TradingBot:
     async def run_async(self):
         """Run the bot asynchronously."""
         self._running = True
-        self._loop = asyncio.get_event_loop()
+        # Set before any feed starts, so callbacks can use it without a fallback
+        self._loop = asyncio.get_running_loop()
+        # Bound once; both entry paths submit through these
+        self._submit = self._loop.run_in_executor
+        self._execute_entry = self.order_executor.execute_entry
 
         # Start keyboard reader in separate thread
-        reader_thread = threading.Thread(target=self._stdin_reader, daemon=True)
-        reader_thread.start()
+        self._reader_thread = threading.Thread(target=self._stdin_reader, daemon=True)
+        self._reader_thread.start()
 
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        print(colored(
+        timestamp = now_hms()
+        self._emit(paint(
             f"\n[{timestamp}] Bot ready. Keys: 'u'=UP, 'd'=DOWN, 'k'=kill switch, "
             f"'x'=exit, 's'=status, 'q'=quit",
             "cyan",
         ))
 
-        # Run both WebSocket feeds concurrently
+        # Run all WebSocket feeds concurrently; named tasks show up in
+        # tracebacks/task dumps, and the group cancels siblings together
         try:
-            await asyncio.gather(
-                self.price_stream.connect(),
-                self.coinbase_feed.connect(),
-            )
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(self.price_stream.connect(), name="polymarket-ws")
+                tg.create_task(self.user_stream.connect(), name="polymarket-user-ws")
+                tg.create_task(self.coinbase_feed.connect(), name="coinbase-ws")
         except asyncio.CancelledError:
             pass
 
@@ -489,22 +620,29 @@ class TradingBot:
         """Run the bot (blocking)."""
         self.initialize()
 
+        run_loop = uvloop.run if uvloop is not None else asyncio.run
         try:
-            asyncio.run(self.run_async())
+            run_loop(self.run_async())
         except KeyboardInterrupt:
             pass  # _shutdown already called via 'q' or will be called below
         finally:
             self._shutdown()
+            self._finalize()
+
+        # Reader polls _running, so it exits promptly and restores the terminal
+        if self._reader_thread is not None:
+            self._reader_thread.join(timeout=1.0)
+        self._flush_output()
 
         # Final summary
         print("\nSession Summary")
         realized = self.position_manager.get_total_pnl()
         pnl_color = "green" if realized >= 0 else "red"
-        print(colored(f"Total P&L: ${realized:+.2f}", pnl_color))
+        print(paint(f"Total P&L: ${realized:+.2f}", pnl_color))
 
-        open_positions = self.position_manager.list_open_positions()
+        open_positions = self.position_manager.list_active_positions()
         if open_positions:
-            print(colored(
+            print(paint(
                 f"Warning: {len(open_positions)} position(s) still open!",
                 "yellow",
             ))
@@ -1,10 +1,10 @@
 """Market mapper for finding current Bitcoin Up/Down hourly markets."""
 
-import json
 from datetime import datetime
 from typing import Optional
 from zoneinfo import ZoneInfo
 
+import orjson
 import requests
 from termcolor import colored
 
@@ -17,43 +17,41 @@ CLOB_API_URL = "https://clob.polymarket.com"
 # Eastern Time zone (Polymarket uses ET)
 ET = ZoneInfo("America/New_York")
 
+# Slug components (English regardless of locale, unlike strftime("%B"))
+_MONTHS = (
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+)
+# 12-hour clock labels indexed by hour: "12am", "1am", ..., "11pm"
+_HOURS = tuple(f"{(h % 12) or 12}{'am' if h < 12 else 'pm'}" for h in range(24))
+
+# Shared session: keeps the Gamma API connection (and TLS session) alive
+# across lookups instead of reconnecting on every call
+_HTTP = requests.Session()
+_HTTP.headers.update({
+    "Accept": "application/json",
+    "User-Agent": "PolymarketBot/1.0"
+})
+
 
 def get_hourly_slug(dt: datetime) -> str:
     """Construct the slug for an hourly Bitcoin Up or Down market.
 
     Example: "bitcoin-up-or-down-january-20-5pm-et"
     """
-    month = dt.strftime("%B").lower()
-    day = dt.day
-    hour = dt.hour
-
-    # Convert to 12-hour format
-    if hour == 0:
-        hour_str = "12am"
-    elif hour < 12:
-        hour_str = f"{hour}am"
-    elif hour == 12:
-        hour_str = "12pm"
-    else:
-        hour_str = f"{hour - 12}pm"
-
-    return f"bitcoin-up-or-down-{month}-{day}-{hour_str}-et"
+    return f"bitcoin-up-or-down-{_MONTHS[dt.month - 1]}-{dt.day}-{_HOURS[dt.hour]}-et"
 
 
 def fetch_event_by_slug(slug: str) -> Optional[dict]:
     """Fetch an event from Polymarket by its slug."""
-    headers = {
-        "Accept": "application/json",
-        "User-Agent": "PolymarketBot/1.0"
-    }
     params = {"slug": slug}
 
     try:
-        response = requests.get(GAMMA_API_URL, params=params, headers=headers, timeout=30)
+        response = _HTTP.get(GAMMA_API_URL, params=params, timeout=30)
         response.raise_for_status()
-        events = response.json()
+        events = orjson.loads(response.content)
         return events[0] if events else None
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         print(colored(f"  Error fetching {slug}: {e}", "red"))
         return None
 
@@ -71,8 +69,8 @@ def extract_market_from_event(event: dict) -> Optional[dict]:
     clob_token_ids_raw = market.get("clobTokenIds", "[]")
     if isinstance(clob_token_ids_raw, str):
         try:
-            clob_token_ids = json.loads(clob_token_ids_raw)
-        except json.JSONDecodeError:
+            clob_token_ids = orjson.loads(clob_token_ids_raw)
+        except orjson.JSONDecodeError:
             return None
     else:
         clob_token_ids = clob_token_ids_raw or []
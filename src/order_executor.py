@@ -1,14 +1,12 @@
 """Fast order execution with retry logic and partial fill handling."""
 
 import time
-import uuid
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Optional
-
-from termcolor import colored
+from typing import TYPE_CHECKING, Callable, Optional
 
+from .ansi import paint
 from .clob_client import FastClobClient
+from .clock import now_hms
 from .config import Config
 from .position_manager import Position, PositionManager
 
@@ -16,7 +14,7 @@ if TYPE_CHECKING:
     from .price_cache import PriceCache
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderResult:
     """Result of an order execution."""
 
@@ -56,8 +54,23 @@ class OrderExecutor:
         self.position_manager = position_manager
         self.price_cache = price_cache
         self.data_logger = data_logger
+        self._log = data_logger.log if data_logger else None  # Bound once for _log_entry
         self.coinbase_feed = None  # Set after CoinbaseFeed init for btc_price logging
 
+        # Slippage as a price offset, resolved once for the entry path
+        self._slippage_frac = config.slippage_cents / 100
+        # Entry-path calls bound once
+        self._place_buy = clob_client.place_market_buy
+        self._add_position = position_manager.add_position
+        self._debug = config.debug
+
+    def presign_entry(self, token_id: str, best_ask: Optional[float]):
+        """Pre-sign a default-size entry at this ask (called on price updates)."""
+        self.clob_client.presign_market_buy(
+            token_id, self.config.position_size, best_ask,
+            slippage_cents=self.config.slippage_cents,
+        )
+
     def execute_entry(self, direction: str, dollar_amount: Optional[float] = None) -> OrderResult:
         """
         Execute a market entry order.
@@ -69,34 +82,29 @@ class OrderExecutor:
         Returns:
             OrderResult with execution details
         """
-        t_start = time.perf_counter()
+        # Raw monotonic_ns stamps only; timing_ms is built after the order returns
+        t_start = time.monotonic_ns()
 
         if dollar_amount is None:
             dollar_amount = self.config.position_size
 
         # Get token ID based on direction
-        token_id = (
-            self.config.up_token_id if direction == "UP" else self.config.down_token_id
-        )
+        token_id = self.config.token_by_direction[direction]
 
         # Get best ask for entry and best bid for TP/SL calculation
         # Use price cache for low-latency reads, fallback to REST
-        t_cache = time.perf_counter()
+        age = None
         if self.price_cache is not None:
-            best_ask = self.price_cache.get_best_ask(token_id)
-            best_bid = self.price_cache.get_best_bid(token_id)
-            age = self.price_cache.get_age_ms(token_id)
-            age_str = f"{age:.0f}ms" if age is not None else "N/A"
-            print(f"   [DEBUG] Prices from cache (age: {age_str})")
+            best_ask, best_bid, age = self.price_cache.get_quote(token_id)
         else:
-            best_ask = self.clob_client.get_best_ask(token_id)
-            best_bid = self.clob_client.get_best_bid(token_id)
-            print("   [DEBUG] Prices from REST (no cache)")
-        cache_read_ms = (time.perf_counter() - t_cache) * 1000
+            book = self.clob_client.get_order_book(token_id)
+            best_ask = self.clob_client.get_best_ask(token_id, book=book)
+            best_bid = self.clob_client.get_best_bid(token_id, book=book)
+        t_cached = time.monotonic_ns()
 
         if not best_ask:
-            total_ms = (time.perf_counter() - t_start) * 1000
-            timing = {"cache_read_ms": round(cache_read_ms, 1), "total_ms": round(total_ms, 1)}
+            if self._debug:
+                self._print_price_source(age)
             order_result = OrderResult(
                 success=False,
                 direction=direction,
@@ -104,42 +112,51 @@ class OrderExecutor:
                 filled_shares=0.0,
                 fill_price=0.0,
                 error_msg="No asks available in orderbook",
-                timing_ms=timing,
+                timing_ms=self._timing_ms(t_start, t_cached, time.monotonic_ns()),
             )
             self._log_entry(order_result, token_id, best_bid, best_ask)
             return order_result
 
         # Pre-generate position ID for correlation across entry/exit logs
-        position_id = str(uuid.uuid4())[:8]
+        position_id = self.position_manager.new_position_id()
 
         # Calculate the limit price that will be submitted to the exchange
         limit_price = best_ask
-        if self.config.slippage_cents > 0:
-            limit_price = min(best_ask + self.config.slippage_cents / 100, 0.99)
+        if self._slippage_frac > 0:
+            limit_price = min(best_ask + self._slippage_frac, 0.99)
 
         # Place market buy order (pass cached price to avoid REST call)
-        # The CLOB client internally does: create_order (ECDSA signing) + post_order (HTTP)
-        t_order = time.perf_counter()
-        result = self.clob_client.place_market_buy(
+        # The CLOB client POSTs a pre-signed order when one matches, else
+        # does create_order (ECDSA signing) + post_order (HTTP)
+        t_order = time.monotonic_ns()
+        result = self._place_buy(
             token_id, dollar_amount, price=best_ask,
             slippage_cents=self.config.slippage_cents,
         )
-        order_ms = (time.perf_counter() - t_order) * 1000
+        t_ordered = time.monotonic_ns()
+        # Printed once the order is out: stdout can block
+        if self._debug:
+            self._print_price_source(age)
 
         # Capture order metadata for logging
-        order_id = result.get("orderID")
-        requested_shares_submitted = result.get("requested")
-
-        # Parse response
-        t_parse = time.perf_counter()
-        if result.get("success"):
-            filled_shares = result.get("filled", 0.0)
-            fill_price = result.get("price", best_ask)
-
-            if filled_shares > 0:
+        order_id = result.order_id
+        requested_shares_submitted = result.requested
+
+        # Parse response into the fields that differ by outcome
+        success = False
+        filled_shares = 0.0
+        fill_price = 0.0
+        position = None
+        partial_fill = False
+        error_msg = None
+        if result.success:
+            filled = result.filled
+            if filled > 0:
+                filled_shares = filled
+                fill_price = result.price
                 # Create position with filled amount
                 # Pass entry_bid for TP/SL calculation (what we'd get if we sold now)
-                position = self.position_manager.add_position(
+                position = self._add_position(
                     direction=direction,
                     token_id=token_id,
                     entry_price=fill_price,
@@ -147,79 +164,55 @@ class OrderExecutor:
                     entry_bid=best_bid,
                     position_id=position_id,
                 )
-                parse_ms = (time.perf_counter() - t_parse) * 1000
-                total_ms = (time.perf_counter() - t_start) * 1000
-                timing = {
-                    "cache_read_ms": round(cache_read_ms, 1),
-                    "order_ms": round(order_ms, 1),
-                    "parse_ms": round(parse_ms, 1),
-                    "total_ms": round(total_ms, 1),
-                }
-
-                order_result = OrderResult(
-                    success=True,
-                    direction=direction,
-                    requested_amount=dollar_amount,
-                    filled_shares=filled_shares,
-                    fill_price=fill_price,
-                    position=position,
-                    partial_fill=(filled_shares < dollar_amount / best_ask * 0.95),
-                    timing_ms=timing,
-                    position_id=position_id,
-                    limit_price=limit_price,
-                    requested_shares=requested_shares_submitted,
-                    order_id=order_id,
-                )
-                self._log_entry(order_result, token_id, best_bid, best_ask)
-                return order_result
+                success = True
+                # Compare against the size actually submitted (whole shares,
+                # slippage-capped) rather than re-deriving it from the ask
+                expected = requested_shares_submitted or dollar_amount / best_ask
+                partial_fill = filled_shares < expected * 0.95
             else:
-                parse_ms = (time.perf_counter() - t_parse) * 1000
-                total_ms = (time.perf_counter() - t_start) * 1000
-                timing = {
-                    "cache_read_ms": round(cache_read_ms, 1),
-                    "order_ms": round(order_ms, 1),
-                    "parse_ms": round(parse_ms, 1),
-                    "total_ms": round(total_ms, 1),
-                }
-                order_result = OrderResult(
-                    success=False,
-                    direction=direction,
-                    requested_amount=dollar_amount,
-                    filled_shares=0.0,
-                    fill_price=0.0,
-                    error_msg="Order submitted but no fill received",
-                    timing_ms=timing,
-                    position_id=position_id,
-                    limit_price=limit_price,
-                    requested_shares=requested_shares_submitted,
-                    order_id=order_id,
-                )
-                self._log_entry(order_result, token_id, best_bid, best_ask)
-                return order_result
+                error_msg = "Order submitted but no fill received"
         else:
-            parse_ms = (time.perf_counter() - t_parse) * 1000
-            total_ms = (time.perf_counter() - t_start) * 1000
-            timing = {
-                "cache_read_ms": round(cache_read_ms, 1),
-                "order_ms": round(order_ms, 1),
-                "parse_ms": round(parse_ms, 1),
-                "total_ms": round(total_ms, 1),
-            }
-            order_result = OrderResult(
-                success=False,
-                direction=direction,
-                requested_amount=dollar_amount,
-                filled_shares=0.0,
-                fill_price=0.0,
-                error_msg=result.get("errorMsg", "Unknown error"),
-                timing_ms=timing,
-                position_id=position_id,
-                limit_price=limit_price,
-                requested_shares=requested_shares_submitted,
-                order_id=order_id,
-            )
-            self._log_entry(order_result, token_id, best_bid, best_ask)
-            return order_result
+            error_msg = result.error_msg or "Unknown error"
+
+        order_result = OrderResult(
+            success=success,
+            direction=direction,
+            requested_amount=dollar_amount,
+            filled_shares=filled_shares,
+            fill_price=fill_price,
+            position=position,
+            error_msg=error_msg,
+            partial_fill=partial_fill,
+            timing_ms=self._timing_ms(
+                t_start, t_cached, time.monotonic_ns(), t_order, t_ordered
+            ),
+            position_id=position_id,
+            limit_price=limit_price,
+            requested_shares=requested_shares_submitted,
+            order_id=order_id,
+        )
+        self._log_entry(order_result, token_id, best_bid, best_ask)
+        return order_result
+
+    def _print_price_source(self, age: Optional[float]):
+        """Debug: where execute_entry read its prices from."""
+        if self.price_cache is None:
+            print("   [DEBUG] Prices from REST (no cache)")
+        else:
+            age_str = f"{age:.0f}ms" if age is not None else "N/A"
+            print(f"   [DEBUG] Prices from cache (age: {age_str})")
+
+    @staticmethod
+    def _timing_ms(
+        t_start: int, t_cached: int, t_end: int, t_order: int = 0, t_ordered: int = 0,
+    ) -> dict:
+        """Build the timing_ms log field from monotonic_ns stamps."""
+        timing = {"cache_read_ms": round((t_cached - t_start) / 1e6, 1)}
+        if t_order:
+            timing["order_ms"] = round((t_ordered - t_order) / 1e6, 1)
+            timing["parse_ms"] = round((t_end - t_ordered) / 1e6, 1)
+        timing["total_ms"] = round((t_end - t_start) / 1e6, 1)
+        return timing
 
     def _log_entry(
         self,
@@ -229,7 +222,8 @@ class OrderExecutor:
         best_ask: Optional[float],
     ) -> None:
         """Log entry event to data logger (non-blocking)."""
-        if not self.data_logger:
+        log = self._log
+        if log is None:
             return
         spread_snapshot = None
         if best_bid is not None and best_ask is not None and best_bid > 0:
@@ -239,12 +233,17 @@ class OrderExecutor:
                 "best_ask": best_ask,
                 "spread_cents": round((best_ask - best_bid) * 100),
             }
-        # Get BTC price at fill time from Coinbase feed
+        # Get BTC price at fill time from Coinbase feed, with its age so
+        # prices from a stalled feed can be told apart
         btc_price = None
+        btc_price_age_ms = None
         if self.coinbase_feed is not None:
-            btc_price = self.coinbase_feed.latest_price or None
+            price, received_ns = self.coinbase_feed.latest_tick
+            if price:
+                btc_price = price
+                btc_price_age_ms = (time.monotonic_ns() - received_ns) // 1_000_000
 
-        self.data_logger.log({
+        log({
             "type": "entry",
             "position_id": result.position_id,
             "direction": result.direction,
@@ -259,6 +258,7 @@ class OrderExecutor:
             "success": result.success,
             "error_msg": result.error_msg,
             "btc_price_at_fill": btc_price,
+            "btc_price_age_ms": btc_price_age_ms,
             "polymarket_spread": spread_snapshot,
             "timing_ms": result.timing_ms if result.timing_ms else None,
         })
@@ -275,47 +275,45 @@ class OrderExecutor:
         """
         return await self.position_manager.manual_exit(position_id)
 
-    def format_entry_result(self, result: OrderResult) -> str:
-        """Format entry result for display."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
+    def format_entry_result(self, result: OrderResult, emit: Callable[[str], None]) -> None:
+        """Write entry result lines to emit as they are produced."""
+        timestamp = now_hms()
 
         if result.success:
             pos = result.position
-            lines = [
-                colored(
-                    f"[{timestamp}] Bought {result.filled_shares:.2f} shares {result.direction} "
-                    f"at ${result.fill_price:.2f}",
-                    "cyan",
-                ),
-            ]
+            emit(paint(
+                f"[{timestamp}] Bought {result.filled_shares:.2f} shares {result.direction} "
+                f"at ${result.fill_price:.2f}",
+                "cyan",
+            ))
 
             if pos:
-                lines.append(
+                emit(
                     f"[{timestamp}] TP: ${pos.take_profit_price:.2f} | "
                     f"SL: ${pos.stop_loss_price:.2f}"
                 )
-
-            return "\n".join(lines)
         else:
             # Make FAK "no liquidity" errors concise and yellow (like spread warnings)
             error_msg = result.error_msg or "Unknown error"
             if "no orders found to match with FAK" in error_msg:
-                return colored(
+                emit(paint(
                     f"[{timestamp}] Skipped: no liquidity at price",
                     "yellow",
-                )
-            return colored(
-                f"[{timestamp}] Order failed: {error_msg}",
-                "red",
-            )
+                ))
+            else:
+                emit(paint(
+                    f"[{timestamp}] Order failed: {error_msg}",
+                    "red",
+                ))
 
     def format_exit_result(
         self,
         position: Position,
         reason: str,
-    ) -> str:
-        """Format exit P&L summary. Individual sells are logged inline by position_manager."""
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
+        emit: Callable[[str], None],
+    ) -> None:
+        """Write exit P&L summary to emit. Individual sells are logged inline by position_manager."""
+        timestamp = now_hms()
 
         if position.exit_price:
             pnl = (position.exit_price - position.entry_price) * position.shares
@@ -323,12 +321,12 @@ class OrderExecutor:
             pnl_color = "green" if pnl >= 0 else "red"
             pnl_sign = "+" if pnl >= 0 else "-"
 
-            return colored(
+            emit(paint(
                 f"[{timestamp}] P&L: {pnl_sign}${abs(pnl):.2f} ({pnl_pct:+.1f}%)",
                 pnl_color,
-            )
+            ))
         else:
-            return colored(
+            emit(paint(
                 f"[{timestamp}] Position {position.id} closed (no fill data)",
                 "yellow",
-            )
+            ))
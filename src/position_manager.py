@@ -1,16 +1,17 @@
 """Position manager for tracking open positions and TP/SL exits."""
 
-import asyncio
+import itertools
+import random
 import time
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Callable, Optional
 
-from termcolor import colored
-
+from .ansi import paint
 from .clob_client import FastClobClient
+from .clock import now_hms
 from .config import Config
 
 if TYPE_CHECKING:
@@ -30,7 +31,16 @@ class ExitReason(Enum):
     MANUAL = "MANUAL"
 
 
-@dataclass
+# Color of the "<reason> triggered" line printed by trigger_exit
+_REASON_COLORS = {
+    ExitReason.TAKE_PROFIT: "green",
+    ExitReason.STOP_LOSS: "red",
+    ExitReason.STALE_BREAKEVEN: "cyan",
+    ExitReason.MANUAL: "yellow",
+}
+
+
+@dataclass(slots=True)
 class Position:
     """Represents an open trading position."""
 
@@ -52,6 +62,9 @@ class Position:
     is_stale: bool = False  # True after stale_position_sec without TP
     stale_since_ms: Optional[float] = None  # When position became stale
 
+    # time.monotonic_ns() at entry, for per-tick age checks
+    entry_mono_ns: int = 0
+
     @property
     def cost_basis(self) -> float:
         """Total cost of the position."""
@@ -84,6 +97,44 @@ class PositionManager:
         self.price_cache = price_cache
 
         self.positions: dict[str, Position] = {}
+        # token_id -> {position_id: Position} for OPEN/CLOSING positions, so
+        # per-signal checks don't scan every position ever opened
+        self._active_by_token: dict[str, dict[str, Position]] = {}
+        # position_id -> Position for OPEN/CLOSING positions, in entry order
+        self._active: dict[str, Position] = {}
+        # CLOSED positions in close order, so P&L totals and trade stats skip
+        # the open and closing ones (appended from exit threads; list.append
+        # is atomic)
+        self._closed: list[Position] = []
+        # token_id -> (highest SL, lowest TP/breakeven exit, monotonic ns when
+        # a position can next turn stale) over the token's OPEN positions; a bid
+        # strictly inside the band before that time can't trigger any exit
+        self._exit_band: dict[str, tuple[float, float, float]] = {}
+        # token_id -> count of positions added; add_position (order-io thread)
+        # bumps it so a band computed from an older snapshot is discarded
+        self._band_gen: dict[str, int] = {}
+        self._stale_after_ns = int(config.stale_position_sec * 1e9)
+        # TP/SL price multipliers, resolved once for add_position
+        self._tp_mult = 1 + config.take_profit_pct
+        self._sl_mult = 1 - config.stop_loss_pct
+        # Blocking exit loops run here rather than in the loop's default
+        # executor, which is shared with every other library on the loop
+        self._exit_executor = ThreadPoolExecutor(
+            max_workers=config.max_concurrent_exits, thread_name_prefix="exit"
+        )
+
+        # 8-hex-char position IDs: per-session random prefix + entry counter
+        # (no urandom read or uuid formatting on the entry path)
+        self._id_prefix = f"{random.getrandbits(16):04x}"
+        self._id_counter = itertools.count(1)
+
+    def close(self):
+        """Stop accepting exits and wait for queued and running ones to finish."""
+        self._exit_executor.shutdown(wait=True)
+
+    def new_position_id(self) -> str:
+        """Return a fresh position ID, unique within the session."""
+        return f"{self._id_prefix}{next(self._id_counter):04x}"
 
     def add_position(
         self,
@@ -106,14 +157,14 @@ class PositionManager:
             position_id: Optional pre-generated position ID for log correlation
         """
         if position_id is None:
-            position_id = str(uuid.uuid4())[:8]
+            position_id = self.new_position_id()
 
         # TP from entry_price (ask): target is above what we paid
-        tp_price = round(entry_price * (1 + self.config.take_profit_pct), 2)
+        tp_price = round(entry_price * self._tp_mult, 2)
 
         # SL from bid: triggers when bid drops below threshold
         sl_reference = entry_bid if entry_bid and entry_bid > 0 else entry_price
-        sl_price = round(sl_reference * (1 - self.config.stop_loss_pct), 2)
+        sl_price = round(sl_reference * self._sl_mult, 2)
 
         # Guards: TP at least one tick above entry; SL at least one tick below reference
         if tp_price <= entry_price:
@@ -121,18 +172,27 @@ class PositionManager:
         if sl_price >= sl_reference:
             sl_price = round(sl_reference - 0.01, 2)
 
+        entry_time = datetime.now(timezone.utc)
         position = Position(
             id=position_id,
             direction=direction,
             token_id=token_id,
             entry_price=entry_price,
             shares=shares,
-            entry_time=datetime.now(timezone.utc),
+            entry_time=entry_time,
+            entry_mono_ns=time.monotonic_ns(),
             take_profit_price=tp_price,
             stop_loss_price=sl_price,
         )
 
         self.positions[position_id] = position
+        self._active_by_token.setdefault(token_id, {})[position_id] = position
+        self._active[position_id] = position
+        # Bump after the insert, then drop the band: a concurrent
+        # check_exit_conditions that missed this position sees the new
+        # generation and won't keep its band
+        self._band_gen[token_id] = self._band_gen.get(token_id, 0) + 1
+        self._exit_band.pop(token_id, None)  # Re-evaluate on the next tick
         return position
 
     def get_position(self, position_id: str) -> Optional[Position]:
@@ -141,14 +201,28 @@ class PositionManager:
 
     def list_open_positions(self) -> list[Position]:
         """Return list of open positions."""
-        return [p for p in self.positions.values() if p.status == PositionStatus.OPEN]
+        return [p for p in list(self._active.values()) if p.status == PositionStatus.OPEN]
+
+    def list_active_positions(self) -> list[Position]:
+        """Return OPEN and CLOSING positions (not yet fully exited)."""
+        return list(self._active.values())
 
     def has_active_position(self, token_id: str) -> bool:
         """Check if any OPEN or CLOSING position exists for this token."""
-        return any(
-            pos.token_id == token_id and pos.status in (PositionStatus.OPEN, PositionStatus.CLOSING)
-            for pos in self.positions.values()
-        )
+        return bool(self._active_by_token.get(token_id))
+
+    def active_positions(self, token_id: str) -> list[Position]:
+        """Return OPEN and CLOSING positions for this token."""
+        return list(self._active_by_token.get(token_id, {}).values())
+
+    def _mark_closed(self, position: Position):
+        """Set CLOSED status and move the position from the active index to the closed list."""
+        position.status = PositionStatus.CLOSED
+        # Empty per-token dicts are kept (one per market token) so a
+        # concurrent add_position never inserts into a detached dict
+        self._active_by_token.get(position.token_id, {}).pop(position.id, None)
+        self._active.pop(position.id, None)
+        self._closed.append(position)
 
     def check_exit_conditions(self, token_id: str, current_bid: float):
         """
@@ -164,62 +238,109 @@ class PositionManager:
         if current_bid is None:
             return
 
-        now_ms = time.time() * 1000
+        active = self._active_by_token.get(token_id)
+        if not active:
+            return
 
-        for pos in list(self.positions.values()):
-            if pos.token_id != token_id or pos.status != PositionStatus.OPEN:
-                continue
+        now_ns = time.monotonic_ns()
 
-            # Check take profit
-            if current_bid >= pos.take_profit_price:
-                asyncio.create_task(
-                    self._async_trigger_exit(pos, ExitReason.TAKE_PROFIT, current_bid)
-                )
+        # Most ticks land between every position's SL and TP; compare against
+        # the cached band instead of walking the positions
+        band = self._exit_band.get(token_id)
+        if band is not None and band[0] < current_bid < band[1] and now_ns < band[2]:
+            return
+
+        # Read before the snapshot: if add_position runs meanwhile, the band
+        # below may not cover its position
+        band_gen = self._band_gen.get(token_id, 0)
+        stale_after_ns = self._stale_after_ns
+        band_lo = float("-inf")
+        band_hi = float("inf")
+        recheck_at_ns = float("inf")
+
+        # Snapshot: exit threads pop closed positions from this dict
+        for pos in tuple(active.values()):
+            if pos.status != PositionStatus.OPEN:
                 continue
 
-            # Check stop loss
-            if current_bid <= pos.stop_loss_price:
-                asyncio.create_task(
-                    self._async_trigger_exit(pos, ExitReason.STOP_LOSS, current_bid)
-                )
+            tp_price = pos.take_profit_price
+            sl_price = pos.stop_loss_price
+            if sl_price < current_bid < tp_price:
+                # Common case: inside the TP/SL band, only staleness can exit
+                reason = None
+
+                # Check if position became stale (no TP within stale_position_sec)
+                if not pos.is_stale:
+                    age_ns = now_ns - pos.entry_mono_ns
+                    if age_ns >= stale_after_ns:
+                        pos.is_stale = True
+                        pos.stale_since_ms = time.time() * 1000
+                        if self.data_logger:
+                            self.data_logger.log({
+                                "type": "stale_position",
+                                "position_id": pos.id,
+                                "age_sec": round(age_ns / 1e9, 1),
+                                "current_bid": current_bid,
+                            })
+                    else:
+                        recheck_at_ns = min(recheck_at_ns, pos.entry_mono_ns + stale_after_ns)
+
+                # Stale breakeven exit: if stale AND can exit at breakeven or better
+                # If underwater, wait for price to recover or hit stop loss
+                # Note: entry_price is the ASK we paid, but we sell at BID. We need
+                # bid >= entry + 1 tick to actually break even after spread cost.
+                if pos.is_stale:
+                    breakeven_price = pos.entry_price + 0.01
+                    if current_bid >= breakeven_price:
+                        reason = ExitReason.STALE_BREAKEVEN
+                    else:
+                        band_hi = min(band_hi, breakeven_price)
+            else:
+                reason = ExitReason.TAKE_PROFIT if current_bid >= tp_price else ExitReason.STOP_LOSS
+
+            if reason is not None:
+                self._schedule_exit(pos, reason, current_bid)
                 continue
 
-            # Check if position became stale (no TP within stale_position_sec)
-            entry_time_ms = pos.entry_time.timestamp() * 1000
-            position_age_sec = (now_ms - entry_time_ms) / 1000.0
-
-            if not pos.is_stale and position_age_sec >= self.config.stale_position_sec:
-                pos.is_stale = True
-                pos.stale_since_ms = now_ms
-                if self.data_logger:
-                    self.data_logger.log({
-                        "type": "stale_position",
-                        "position_id": pos.id,
-                        "age_sec": round(position_age_sec, 1),
-                        "current_bid": current_bid,
-                    })
-
-            # Stale breakeven exit: if stale AND can exit at breakeven or better
-            # If underwater, wait for price to recover or hit stop loss
-            # Note: entry_price is the ASK we paid, but we sell at BID. We need
-            # bid >= entry + 1 tick to actually break even after spread cost.
-            if pos.is_stale and current_bid >= pos.entry_price + 0.01:
-                asyncio.create_task(
-                    self._async_trigger_exit(pos, ExitReason.STALE_BREAKEVEN, current_bid)
-                )
+            # Still open after this tick: narrow the band to its exit prices
+            band_lo = max(band_lo, sl_price)
+            band_hi = min(band_hi, tp_price)
 
-    async def _async_trigger_exit(
-        self,
-        position: Position,
-        reason: ExitReason,
-        trigger_price: float,
-    ):
-        """Async wrapper for trigger_exit to run in task."""
-        if position.status != PositionStatus.OPEN:
-            return  # Already being closed (no race: no await between check and set)
+        self._exit_band[token_id] = (band_lo, band_hi, recheck_at_ns)
+        # Checked after the store, so an add_position racing with it either
+        # pops the band itself or is seen here
+        if self._band_gen.get(token_id, 0) != band_gen:
+            self._exit_band.pop(token_id, None)
+
+    def _schedule_exit(
+        self, position: Position, reason: ExitReason, trigger_price: Optional[float],
+    ) -> bool:
+        """Claim an OPEN position and queue its exit on the exit pool.
+
+        The status flips to CLOSING before the exit is queued, so later ticks
+        skip the position instead of queuing exits that would only bail out.
+        Exits go straight to the pool (no asyncio task around them), so the
+        event loop shutting down can't cancel one still waiting for a worker;
+        close() then waits for every queued exit.
+
+        Returns:
+            False if the pool is already shut down (position reverted to OPEN)
+        """
         position.status = PositionStatus.CLOSING  # prevent re-entry
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self.trigger_exit, position, reason, trigger_price)
+        try:
+            future = self._exit_executor.submit(self.trigger_exit, position, reason, trigger_price)
+        except RuntimeError:
+            position.status = PositionStatus.OPEN  # Closing; nothing will sell it
+            return False
+        future.add_done_callback(self._on_exit_done)
+        return True
+
+    @staticmethod
+    def _on_exit_done(future):
+        """Report an exit that raised (runs on the exit thread)."""
+        error = future.exception()
+        if error is not None:
+            print(paint(f"[{now_hms()}] Exit failed: {error}", "red"))
 
     # Dust threshold: remaining shares worth less than this are not worth
     # aggressively retrying via FAK. A GTC limit sell is placed instead.
@@ -249,11 +370,10 @@ class PositionManager:
         fill_prices = []
 
         # Log trigger and sell intent
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-        reason_colors = {"TAKE_PROFIT": "green", "STOP_LOSS": "red", "STALE_BREAKEVEN": "cyan", "MANUAL": "yellow"}
-        print(colored(
+        timestamp = now_hms()
+        print(paint(
             f"[{timestamp}] {reason.value} triggered",
-            reason_colors.get(reason.value, "white"),
+            _REASON_COLORS.get(reason, "white"),
         ))
         print(f"[{timestamp}] Placing Sell {position.direction} order...")
 
@@ -294,7 +414,7 @@ class PositionManager:
             # No fills at all - use current best bid for P&L calculation
             position.exit_price = self._get_cached_best_bid(position.token_id) or 0
 
-        position.status = PositionStatus.CLOSED
+        self._mark_closed(position)
         position.exit_time = datetime.now(timezone.utc)
         position.exit_reason = reason
 
@@ -318,7 +438,8 @@ class PositionManager:
         """Get Polymarket bid/ask/spread for logging.
 
         Uses PriceCache when available (no REST calls, ~0ms).
-        Falls back to REST API only if cache is unavailable.
+        Falls back to a single REST order book fetch when the cache is
+        unavailable or stale.
         """
         if self.price_cache is not None:
             snapshot = self.price_cache.get(token_id)
@@ -334,9 +455,10 @@ class PositionManager:
                     "spread_cents": round((best_ask - best_bid) * 100),
                 }
 
-        # Fallback to REST (2 separate order book fetches)
-        best_bid = self.clob_client.get_best_bid(token_id)
-        best_ask = self.clob_client.get_best_ask(token_id)
+        # Fallback to REST: one order book fetch for both sides
+        book = self.clob_client.get_order_book(token_id)
+        best_bid = self.clob_client.get_best_bid(token_id, book=book)
+        best_ask = self.clob_client.get_best_ask(token_id, book=book)
         if best_bid is None or best_ask is None or best_bid <= 0:
             return None
         return {
@@ -364,7 +486,12 @@ class PositionManager:
             pnl_dollars = (position.exit_price - position.entry_price) * position.shares
             pnl_pct = ((position.exit_price - position.entry_price) / position.entry_price) * 100
         fill_details = [
-            {"qty": q, "price": p, "ts": ts, "order_id": oid}
+            {
+                "qty": q,
+                "price": p,
+                "ts": datetime.fromtimestamp(ts, timezone.utc).isoformat(),
+                "order_id": oid,
+            }
             for q, p, ts, oid in fill_prices
         ]
         order_ids = [oid for _, _, _, oid in fill_prices if oid]
@@ -395,7 +522,7 @@ class PositionManager:
         size*price pair at that price), retry once at best_bid - $0.01.
         A penny worse, but more likely to find a valid size/price combination.
         """
-        timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
+        timestamp = now_hms()
         dust_value = remaining * best_bid
 
         result = self.clob_client.place_limit_sell(
@@ -406,8 +533,8 @@ class PositionManager:
 
         # Retry once at a lower price if size came out to zero
         if (
-            not result.get("success")
-            and "size is zero" in (result.get("errorMsg") or "").lower()
+            not result.success
+            and "size is zero" in (result.error_msg or "").lower()
             and best_bid - 0.01 >= 0.01
         ):
             retry_price = round(best_bid - 0.01, 2)
@@ -416,20 +543,20 @@ class PositionManager:
                 remaining,
                 retry_price,
             )
-            if result.get("success"):
+            if result.success:
                 best_bid = retry_price  # update for log message
                 dust_value = remaining * best_bid
 
-        if result.get("success"):
-            sell_price = result.get("price", best_bid)
-            print(colored(
+        if result.success:
+            sell_price = result.price
+            print(paint(
                 f"[{timestamp}] Placed GTC sell for {remaining:.2f} shares "
                 f"{position.direction} at ${sell_price:.2f} (~${dust_value:.2f} dust)",
                 "yellow",
             ))
         else:
-            error = result.get("errorMsg", "unknown")
-            print(colored(
+            error = result.error_msg or "unknown"
+            print(paint(
                 f"[{timestamp}] Could not place GTC for {remaining:.2f} dust shares: {error}",
                 "red",
             ))
@@ -489,28 +616,28 @@ class PositionManager:
                 slippage_cents=self.config.slippage_cents,
             )
 
-            if result.get("success"):
-                filled = result.get("filled", 0.0)
-                fill_price = result.get("price", best_bid)
+            if result.success:
+                filled = result.filled
+                fill_price = result.price
 
                 if filled > 0:
                     total_filled += filled
-                    fill_ts = datetime.now(timezone.utc).isoformat()
-                    sell_order_id = result.get("orderID")
+                    fill_ts = time.time()  # Formatted in _log_exit, off the sell loop
+                    sell_order_id = result.order_id
                     fill_prices.append((filled, fill_price, fill_ts, sell_order_id))
                     remaining -= filled
                     consecutive_failures = 0  # Reset on any fill
 
                     # Log the fill
-                    timestamp = datetime.now(timezone.utc).strftime("%H:%M:%S")
-                    print(colored(
+                    timestamp = now_hms()
+                    print(paint(
                         f"[{timestamp}] Sold {filled:.2f} shares {direction} at ${fill_price:.2f}",
                         "cyan",
                     ))
 
                     # If partial, log retry and immediately try again
                     if remaining > 0.01:
-                        print(colored(
+                        print(paint(
                             f"[{timestamp}] {remaining:.2f} shares unfilled, retrying Sell {direction} order...",
                             "yellow",
                         ))
@@ -526,7 +653,8 @@ class PositionManager:
 
     async def manual_exit(self, position_id: str) -> bool:
         """
-        Manually close a position.
+        Manually close a position. Returns once the exit is queued on the
+        exit pool; the sell itself runs there.
 
         Returns:
             True if exit was initiated, False if position not found or already closing
@@ -535,26 +663,23 @@ class PositionManager:
         if not position or position.status != PositionStatus.OPEN:
             return False
 
-        position.status = PositionStatus.CLOSING
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self.trigger_exit, position, ExitReason.MANUAL, None)
-        return True
+        return self._schedule_exit(position, ExitReason.MANUAL, None)
 
     def get_total_pnl(self) -> float:
         """Calculate total realized P&L from closed positions."""
-        total = 0.0
-        for pos in self.positions.values():
-            if pos.status == PositionStatus.CLOSED and pos.exit_price:
-                total += (pos.exit_price - pos.entry_price) * pos.shares
-        return total
+        return sum(
+            ((pos.exit_price - pos.entry_price) * pos.shares
+             for pos in self._closed if pos.exit_price),
+            0.0,
+        )
 
     def get_trade_stats(self) -> dict:
         """Calculate trade statistics from closed positions."""
         wins = 0
         losses = 0
         breakevens = 0
-        for pos in self.positions.values():
-            if pos.status == PositionStatus.CLOSED and pos.exit_price is not None:
+        for pos in self._closed:
+            if pos.exit_price is not None:
                 pnl = round((pos.exit_price - pos.entry_price) * pos.shares, 2)
                 if pnl > 0:
                     wins += 1
@@ -572,11 +697,26 @@ class PositionManager:
             "win_rate": win_rate,
         }
 
-    def get_position_summary(self, position: Position, current_bid: Optional[float] = None) -> str:
-        """Get formatted summary string for a position."""
-        if current_bid is None:
-            current_bid = self.clob_client.get_best_bid(position.token_id)
+    def get_best_bids(self, positions: list[Position]) -> dict[str, Optional[float]]:
+        """Best bid per token for these positions, one concurrent book fetch per token."""
+        books = self.clob_client.get_order_books([pos.token_id for pos in positions])
+        return {
+            token_id: self.clob_client.get_best_bid(token_id, book=book)
+            for token_id, book in books.items()
+        }
 
+    def summarize_many(
+        self,
+        positions: list[Position],
+        bids: Optional[dict[str, Optional[float]]] = None,
+    ) -> list[str]:
+        """Summary strings for several positions (pass `bids` to skip the fetch)."""
+        if bids is None:
+            bids = self.get_best_bids(positions)
+        return [self._format_summary(pos, bids.get(pos.token_id)) for pos in positions]
+
+    def _format_summary(self, position: Position, current_bid: Optional[float]) -> str:
+        """Format a position summary at the given bid (no price fetch)."""
         if current_bid:
             pnl = position.pnl(current_bid)
             pnl_pct = position.pnl_pct(current_bid)
@@ -585,7 +725,7 @@ class PositionManager:
             return (
                 f"{position.direction} {position.shares:.2f} @ ${position.entry_price:.2f} "
                 f"-> ${current_bid:.2f} "
-                f"({colored(f'{pnl_pct:+.1f}%', pnl_color)})"
+                f"({paint(f'{pnl_pct:+.1f}%', pnl_color)})"
             )
         else:
             return (
@@ -6,14 +6,14 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PriceSnapshot:
     """A snapshot of bid/ask prices for a token."""
 
     token_id: str
     best_bid: Optional[float]
     best_ask: Optional[float]
-    timestamp_ms: float  # Unix timestamp in milliseconds
+    timestamp_ns: int  # time.monotonic_ns() when received
 
 
 class PriceCache:
@@ -22,6 +22,12 @@ class PriceCache:
 
     Updated by WebSocket client, read by signal controller and order executor.
     Provides staleness detection to reject prices older than configured threshold.
+
+    Each update publishes a new (best_bid, best_ask, timestamp_ns) tuple with a
+    single dict store, so readers take no lock: a dict lookup always sees a
+    complete entry. The lock only serializes writers' read-merge-store.
+    Plain tuples keep the per-tick write cheap; get() wraps one in a
+    PriceSnapshot for callers that want named fields.
     """
 
     def __init__(self, stale_ms: int = 5000):
@@ -31,9 +37,21 @@ class PriceCache:
         Args:
             stale_ms: Prices older than this are considered stale (default 5 seconds)
         """
-        self._stale_ms = stale_ms
-        self._prices: dict[str, PriceSnapshot] = {}
+        self._stale_ns = stale_ms * 1_000_000
+        # token_id -> (best_bid, best_ask, time.monotonic_ns() when received)
+        self._prices: dict[str, tuple[Optional[float], Optional[float], int]] = {}
         self._lock = threading.Lock()
+        # Max acceptable spread in price units, set once via set_max_spread_cents
+        self._max_spread: Optional[float] = None
+
+    def set_max_spread_cents(self, max_spread_cents: int):
+        """
+        Set the spread limit used by is_spread_acceptable.
+
+        Args:
+            max_spread_cents: Maximum acceptable spread in cents (e.g., 1 = 1 cent)
+        """
+        self._max_spread = max_spread_cents * 0.01
 
     def update(self, token_id: str, best_bid: Optional[float], best_ask: Optional[float]):
         """
@@ -44,7 +62,7 @@ class PriceCache:
             best_bid: Best bid price (or None if unchanged)
             best_ask: Best ask price (or None if unchanged)
         """
-        now_ms = time.time() * 1000
+        now_ns = time.monotonic_ns()
 
         with self._lock:
             existing = self._prices.get(token_id)
@@ -52,16 +70,11 @@ class PriceCache:
             # Merge with existing values if only partial update
             if existing:
                 if best_bid is None:
-                    best_bid = existing.best_bid
+                    best_bid = existing[0]
                 if best_ask is None:
-                    best_ask = existing.best_ask
+                    best_ask = existing[1]
 
-            self._prices[token_id] = PriceSnapshot(
-                token_id=token_id,
-                best_bid=best_bid,
-                best_ask=best_ask,
-                timestamp_ms=now_ms,
-            )
+            self._prices[token_id] = (best_bid, best_ask, now_ns)
 
     def get(self, token_id: str) -> Optional[PriceSnapshot]:
         """
@@ -70,18 +83,15 @@ class PriceCache:
         Returns:
             PriceSnapshot if available and not stale, None otherwise
         """
-        with self._lock:
-            snapshot = self._prices.get(token_id)
-            if snapshot is None:
-                return None
+        entry = self._prices.get(token_id)
+        if entry is None:
+            return None
 
-            # Check staleness
-            now_ms = time.time() * 1000
-            age_ms = now_ms - snapshot.timestamp_ms
-            if age_ms > self._stale_ms:
-                return None
+        # Check staleness
+        if time.monotonic_ns() - entry[2] > self._stale_ns:
+            return None
 
-            return snapshot
+        return PriceSnapshot(token_id, *entry)
 
     def get_best_bid(self, token_id: str) -> Optional[float]:
         """
@@ -90,10 +100,10 @@ class PriceCache:
         Returns:
             Best bid price if available and not stale, None otherwise
         """
-        snapshot = self.get(token_id)
-        if snapshot is None:
+        entry = self._prices.get(token_id)
+        if entry is None or time.monotonic_ns() - entry[2] > self._stale_ns:
             return None
-        return snapshot.best_bid
+        return entry[0]
 
     def get_best_ask(self, token_id: str) -> Optional[float]:
         """
@@ -102,34 +112,62 @@ class PriceCache:
         Returns:
             Best ask price if available and not stale, None otherwise
         """
-        snapshot = self.get(token_id)
-        if snapshot is None:
+        entry = self._prices.get(token_id)
+        if entry is None or time.monotonic_ns() - entry[2] > self._stale_ns:
             return None
-        return snapshot.best_ask
+        return entry[1]
+
+    def get_quote(
+        self, token_id: str
+    ) -> tuple[Optional[float], Optional[float], Optional[float]]:
+        """
+        Get best ask, best bid and age for a token from one cache entry.
 
-    def is_spread_acceptable(self, token_id: str, max_spread_cents: int) -> bool:
+        Returns:
+            (best_ask, best_bid, age_ms). Prices are None if missing or
+            stale; age_ms is None only if the token has never been cached.
+        """
+        entry = self._prices.get(token_id)
+        if entry is None:
+            return None, None, None
+
+        best_bid, best_ask, ts_ns = entry
+        age_ns = time.monotonic_ns() - ts_ns
+        if age_ns > self._stale_ns:
+            return None, None, age_ns / 1e6
+
+        return best_ask, best_bid, age_ns / 1e6
+
+    def is_spread_acceptable(self, token_id: str) -> bool:
         """
-        Check if the spread for a token is within acceptable range.
+        Check if the spread for a token is within the configured limit.
 
         Args:
             token_id: Token to check
-            max_spread_cents: Maximum acceptable spread in cents (e.g., 1 = 1 cent)
 
         Returns:
             True if spread is acceptable and prices are fresh, False otherwise
+            (always False until set_max_spread_cents has been called)
         """
-        snapshot = self.get(token_id)
-        if snapshot is None:
+        max_spread = self._max_spread
+        if max_spread is None:
             return False
 
-        if snapshot.best_bid is None or snapshot.best_ask is None:
+        entry = self._prices.get(token_id)
+        if entry is None:
             return False
 
-        if snapshot.best_bid <= 0:
+        best_bid, best_ask, ts_ns = entry
+        if time.monotonic_ns() - ts_ns > self._stale_ns:
             return False
 
-        spread = snapshot.best_ask - snapshot.best_bid
-        return spread <= max_spread_cents * 0.01
+        if best_bid is None or best_ask is None:
+            return False
+
+        if best_bid <= 0:
+            return False
+
+        return best_ask - best_bid <= max_spread
 
     def is_stale(self, token_id: str) -> bool:
         """
@@ -153,10 +191,8 @@ class PriceCache:
         Returns:
             Age in milliseconds, or None if no cached price
         """
-        with self._lock:
-            snapshot = self._prices.get(token_id)
-            if snapshot is None:
-                return None
+        entry = self._prices.get(token_id)
+        if entry is None:
+            return None
 
-            now_ms = time.time() * 1000
-            return now_ms - snapshot.timestamp_ms
+        return (time.monotonic_ns() - entry[2]) / 1e6
@@ -37,8 +37,13 @@ class SignalController:
         self.order_executor = order_executor
         self.position_manager = position_manager
         self.price_cache = price_cache
+        if price_cache is not None:
+            price_cache.set_max_spread_cents(config.max_spread_cents)
 
-        self._auto_enabled = True
+        # Plain attribute (not a property) so per-signal reads are a single lookup
+        self.is_enabled = True
+        # Max spread in price units for the REST fallback check
+        self._max_spread = config.max_spread_cents * 0.01
 
     def handle_signal(self, direction: str) -> bool:
         """
@@ -51,14 +56,11 @@ class SignalController:
             True if order was executed, False if skipped
         """
         # Check 1: Auto-signals enabled
-        if not self._auto_enabled:
+        if not self.is_enabled:
             return False
 
         # Check 2: No existing position in this direction
-        token_id = (
-            self.config.up_token_id if direction == "UP"
-            else self.config.down_token_id
-        )
+        token_id = self.config.token_by_direction[direction]
         for pos in self.position_manager.list_open_positions():
             if pos.token_id == token_id:
                 return False
@@ -86,11 +88,12 @@ class SignalController:
         """
         # Try price cache first (no REST call, ~0ms latency)
         if self.price_cache is not None:
-            return self.price_cache.is_spread_acceptable(token_id, self.config.max_spread_cents)
+            return self.price_cache.is_spread_acceptable(token_id)
 
-        # Fallback to REST API (100-200ms latency)
-        best_bid = self.clob_client.get_best_bid(token_id)
-        best_ask = self.clob_client.get_best_ask(token_id)
+        # Fallback to REST API (100-200ms latency); bid and ask from one book
+        book = self.clob_client.get_order_book(token_id)
+        best_bid = self.clob_client.get_best_bid(token_id, book=book)
+        best_ask = self.clob_client.get_best_ask(token_id, book=book)
 
         if best_bid is None or best_ask is None:
             return False
@@ -99,16 +102,12 @@ class SignalController:
             return False
 
         spread = best_ask - best_bid
-        return spread <= self.config.max_spread_cents * 0.01
+        return spread <= self._max_spread
 
     def enable_auto(self):
         """Enable automatic signal handling."""
-        self._auto_enabled = True
+        self.is_enabled = True
 
     def disable_auto(self):
         """Disable automatic signal handling."""
-        self._auto_enabled = False
-
-    @property
-    def is_enabled(self) -> bool:
-        return self._auto_enabled
+        self.is_enabled = False
@@ -1,9 +1,10 @@
 """WebSocket client for real-time price streaming from Polymarket CLOB."""
 
 import asyncio
-import json
-from typing import TYPE_CHECKING, Callable, Optional
+import time
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
+import orjson
 import websockets
 from websockets.exceptions import ConnectionClosed
 
@@ -15,64 +16,83 @@ class PriceStream:
     """Real-time price streaming via WebSocket."""
 
     WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    # Reconnect delay doubles on each consecutive failure, reset once connected
+    RECONNECT_DELAY_SEC = 1.0
+    MAX_RECONNECT_DELAY_SEC = 30.0
 
     def __init__(
         self,
-        token_ids: list[str],
+        token_ids: tuple[str, ...],
         on_price_update: Callable[[str, float, float], None],
         on_connect: Optional[Callable[[], None]] = None,
         on_disconnect: Optional[Callable[[], None]] = None,
         price_cache: Optional["PriceCache"] = None,
         data_logger: Optional[object] = None,
+        debug: bool = False,
     ):
         """
         Initialize price stream.
 
         Args:
-            token_ids: List of token IDs to subscribe to
+            token_ids: Token IDs to subscribe to
             on_price_update: Callback(token_id, best_bid, best_ask) on each update
             on_connect: Optional callback when connected
             on_disconnect: Optional callback when disconnected
             price_cache: Optional shared PriceCache to update on every price message
             data_logger: Optional DataLogger for ws_event logging
+            debug: Print [DEBUG] diagnostics (detected book sort order)
         """
-        self.token_ids = token_ids
+        self.token_ids = tuple(token_ids)
+        # Subscribed tokens; frames for anything else are dropped before any
+        # price parsing
+        self._token_set: frozenset[str] = frozenset(self.token_ids)
         self.on_price_update = on_price_update
         self.on_connect = on_connect
         self.on_disconnect = on_disconnect
         self.price_cache = price_cache
         self.data_logger = data_logger
+        self._debug = debug
+
+        # One subscribe frame for every token, serialized once and resent on
+        # every reconnect
+        self._subscribe_msg = orjson.dumps(
+            {"type": "market", "assets_ids": list(self.token_ids)}
+        ).decode()
 
-        # Current prices cache (internal, for backward compatibility)
-        self.prices: dict[str, dict] = {}
-        for token_id in token_ids:
-            self.prices[token_id] = {"bid": None, "ask": None}
+        # Current best bid/ask per token, as parallel lists indexed by _idx
+        self._idx: dict[str, int] = {tid: i for i, tid in enumerate(self.token_ids)}
+        self._bids: list[Optional[float]] = [None] * len(self.token_ids)
+        self._asks: list[Optional[float]] = [None] * len(self.token_ids)
 
         self._running = False
         self._ws = None
-        self._book_debug_logged = False  # One-time debug log for book snapshots
+        # Book side sort order (True = descending), learned from the first
+        # snapshot whose end prices differ; None until then
+        self._bid_desc: Optional[bool] = None
+        self._ask_desc: Optional[bool] = None
 
     async def connect(self):
         """Connect to WebSocket and start streaming prices."""
         self._running = True
+        delay = self.RECONNECT_DELAY_SEC
 
         while self._running:
             try:
-                async with websockets.connect(self.WS_URL) as ws:
+                async with websockets.connect(
+                    self.WS_URL,
+                    compression=None,  # Frames are small JSON; deflate just burns CPU
+                    max_size=2**20,
+                ) as ws:
                     self._ws = ws
+                    delay = self.RECONNECT_DELAY_SEC
 
                     if self.on_connect:
                         self.on_connect()
                     if self.data_logger:
                         self.data_logger.log({"type": "ws_event", "feed": "polymarket", "event": "reconnect"})
 
-                    # Subscribe to each token's market data
-                    for token_id in self.token_ids:
-                        subscribe_msg = {
-                            "type": "market",
-                            "assets_ids": [token_id],
-                        }
-                        await ws.send(json.dumps(subscribe_msg))
+                    # Subscribe to all tokens' market data
+                    await ws.send(self._subscribe_msg)
 
                     # Process messages
                     async for message in ws:
@@ -86,11 +106,13 @@ class PriceStream:
                 if self.data_logger:
                     self.data_logger.log({"type": "ws_event", "feed": "polymarket", "event": "disconnect"})
                 if self._running:
-                    # Reconnect after brief delay
-                    await asyncio.sleep(1)
-            except Exception as e:
+                    # Reconnect after a delay that backs off while failures repeat
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SEC)
+            except Exception:
                 if self._running:
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SEC)
 
         self._ws = None
 
@@ -98,25 +120,27 @@ class PriceStream:
         """Stop the price stream."""
         self._running = False
 
-    def _process_message(self, message: str):
+    def _process_message(self, message: Union[str, bytes]):
         """Process incoming WebSocket message."""
         try:
-            data = json.loads(message)
-            self._handle_market_data(data)
-        except json.JSONDecodeError:
-            pass
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            return
+        self._handle_market_data(data)
 
     def _handle_market_data(self, data: dict):
         """Handle market data update from WebSocket."""
         # The CLOB WebSocket sends orderbook updates
         # Format varies but typically includes asset_id and book data
 
-        if isinstance(data, list):
+        # orjson yields exact built-in types, so an identity check suffices
+        process = self._process_single_update
+        if type(data) is list:
             # Batch of updates
             for item in data:
-                self._process_single_update(item)
+                process(item)
         else:
-            self._process_single_update(data)
+            process(data)
 
     def _process_single_update(self, data: dict):
         """Process a single market data update."""
@@ -128,7 +152,7 @@ class PriceStream:
         # Extract token ID from various possible formats
         asset_id = data.get("asset_id") or data.get("market") or data.get("token_id")
 
-        if not asset_id or asset_id not in self.prices:
+        if asset_id not in self._token_set:
             return
 
         # Extract best bid/ask from the update
@@ -162,90 +186,231 @@ class PriceStream:
         """
         Extract best bid and best ask from orderbook arrays.
 
-        Auto-detects sort order by comparing first and last elements,
-        so it works regardless of whether the API sends ascending or descending.
+        Auto-detects each side's sort order by comparing first and last
+        elements on the first book where they differ, then reads only the
+        best end of later books (the venue's ordering doesn't change).
         """
         best_bid = None
         best_ask = None
 
         if bids:
-            first_bid = float(bids[0].get("price", 0))
-            last_bid = float(bids[-1].get("price", 0))
-            # Best bid = highest price
-            best_bid = max(first_bid, last_bid)
-
-            # One-time debug log to verify sort order
-            if not self._book_debug_logged and len(bids) > 1:
-                sort_dir = "ascending" if first_bid < last_bid else "descending"
-                print(f"   [DEBUG] WS bids: {sort_dir} (first={first_bid}, last={last_bid}, best={best_bid})")
+            bid_desc = self._bid_desc
+            if bid_desc is not None:
+                best_bid = float(bids[0 if bid_desc else -1].get("price", 0))
+            else:
+                first_bid = float(bids[0].get("price", 0))
+                last_bid = float(bids[-1].get("price", 0))
+                # Best bid = highest price
+                best_bid = max(first_bid, last_bid)
+                if first_bid != last_bid:
+                    self._bid_desc = first_bid > last_bid
+                    # One-time debug log to verify sort order
+                    if self._debug:
+                        sort_dir = "descending" if self._bid_desc else "ascending"
+                        print(f"   [DEBUG] WS bids: {sort_dir} (first={first_bid}, last={last_bid}, best={best_bid})")
 
         if asks:
-            first_ask = float(asks[0].get("price", 0))
-            last_ask = float(asks[-1].get("price", 0))
-            # Best ask = lowest price
-            best_ask = min(first_ask, last_ask)
-
-            if not self._book_debug_logged and len(asks) > 1:
-                sort_dir = "ascending" if first_ask < last_ask else "descending"
-                print(f"   [DEBUG] WS asks: {sort_dir} (first={first_ask}, last={last_ask}, best={best_ask})")
-
-        if bids and asks and not self._book_debug_logged:
-            self._book_debug_logged = True
+            ask_desc = self._ask_desc
+            if ask_desc is not None:
+                best_ask = float(asks[-1 if ask_desc else 0].get("price", 0))
+            else:
+                first_ask = float(asks[0].get("price", 0))
+                last_ask = float(asks[-1].get("price", 0))
+                # Best ask = lowest price
+                best_ask = min(first_ask, last_ask)
+                if first_ask != last_ask:
+                    self._ask_desc = first_ask > last_ask
+                    if self._debug:
+                        sort_dir = "descending" if self._ask_desc else "ascending"
+                        print(f"   [DEBUG] WS asks: {sort_dir} (first={first_ask}, last={last_ask}, best={best_ask})")
 
         return best_bid, best_ask
 
     def _handle_price_change(self, data: dict):
         """Handle price_change event which includes best_bid/best_ask directly."""
-        price_changes = data.get("price_changes", [])
-        for change in price_changes:
+        # Hot path: the schema is fixed (asset_id, best_bid, best_ask), so
+        # lookups are bound once per frame and each field is read once
+        token_set = self._token_set
+        update_prices = self._update_prices
+        for change in data.get("price_changes", ()):
             asset_id = change.get("asset_id")
-            if not asset_id or asset_id not in self.prices:
+            if asset_id not in token_set:
                 continue
 
             # price_change events include best_bid and best_ask directly
-            best_bid = None
-            best_ask = None
-
-            if "best_bid" in change:
-                best_bid = float(change["best_bid"])
-            if "best_ask" in change:
-                best_ask = float(change["best_ask"])
-
-            self._update_prices(asset_id, best_bid, best_ask)
+            best_bid = change.get("best_bid")
+            best_ask = change.get("best_ask")
+            update_prices(
+                asset_id,
+                float(best_bid) if best_bid is not None else None,
+                float(best_ask) if best_ask is not None else None,
+            )
 
     def _update_prices(self, asset_id: str, best_bid: Optional[float], best_ask: Optional[float]):
-        """Update price cache and notify callback."""
-        if asset_id not in self.prices:
-            return
-
+        """Update price cache and notify callback (asset_id already checked against _token_set)."""
+        i = self._idx[asset_id]
         updated = False
         if best_bid is not None and best_bid > 0:
-            self.prices[asset_id]["bid"] = best_bid
+            self._bids[i] = best_bid
             updated = True
         if best_ask is not None and best_ask > 0:
-            self.prices[asset_id]["ask"] = best_ask
+            self._asks[i] = best_ask
             updated = True
 
         if updated:
-            current = self.prices[asset_id]
+            bid = self._bids[i]
+            ask = self._asks[i]
 
             # Update shared price cache if available (for low-latency reads)
             if self.price_cache is not None:
-                self.price_cache.update(asset_id, current["bid"], current["ask"])
+                self.price_cache.update(asset_id, bid, ask)
 
-            self.on_price_update(
-                asset_id,
-                current["bid"],
-                current["ask"],
-            )
+            self.on_price_update(asset_id, bid, ask)
 
     def get_best_bid(self, token_id: str) -> Optional[float]:
         """Get cached best bid for a token."""
-        return self.prices.get(token_id, {}).get("bid")
+        i = self._idx.get(token_id)
+        return None if i is None else self._bids[i]
 
     def get_best_ask(self, token_id: str) -> Optional[float]:
         """Get cached best ask for a token."""
-        return self.prices.get(token_id, {}).get("ask")
+        i = self._idx.get(token_id)
+        return None if i is None else self._asks[i]
+
+
+class UserStream:
+    """Authenticated user-channel WebSocket that pushes our own order fills."""
+
+    WS_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+    # Same backoff as PriceStream, but reset only after a connection has
+    # stayed up: a rejected subscribe (e.g. bad auth) is accepted and then
+    # dropped by the server, and must not retry at the base rate forever
+    RECONNECT_DELAY_SEC = 1.0
+    MAX_RECONNECT_DELAY_SEC = 30.0
+
+    def __init__(
+        self,
+        api_creds,
+        on_fill: Callable[[str, float, float], None],
+        on_state_change: Optional[Callable[[bool], None]] = None,
+        data_logger: Optional[object] = None,
+    ):
+        """
+        Initialize user stream.
+
+        Args:
+            api_creds: L2 ApiCreds (api_key, api_secret, api_passphrase)
+            on_fill: Callback(order_id, size, price) for each taker fill
+            on_state_change: Optional callback(connected) on connect/disconnect
+            data_logger: Optional DataLogger for ws_event logging
+        """
+        self.api_creds = api_creds
+        self.on_fill = on_fill
+        self.on_state_change = on_state_change
+        self.data_logger = data_logger
+
+        self._running = False
+        self._ws = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def connect(self):
+        """Connect to the user channel and dispatch fills until stopped."""
+        self._running = True
+        self._loop = asyncio.get_running_loop()
+        delay = self.RECONNECT_DELAY_SEC
+
+        while self._running:
+            connected_at = None
+            try:
+                async with websockets.connect(self.WS_URL) as ws:
+                    self._ws = ws
+                    connected_at = time.monotonic()
+
+                    subscribe_msg = {
+                        "type": "user",
+                        "markets": [],
+                        "auth": {
+                            "apiKey": self.api_creds.api_key,
+                            "secret": self.api_creds.api_secret,
+                            "passphrase": self.api_creds.api_passphrase,
+                        },
+                    }
+                    await ws.send(orjson.dumps(subscribe_msg).decode())
+
+                    if self.on_state_change:
+                        self.on_state_change(True)
+                    if self.data_logger:
+                        self.data_logger.log({"type": "ws_event", "feed": "polymarket_user", "event": "reconnect"})
+
+                    async for message in ws:
+                        if not self._running:
+                            break
+                        self._process_message(message)
+
+            except ConnectionClosed:
+                if self.data_logger:
+                    self.data_logger.log({"type": "ws_event", "feed": "polymarket_user", "event": "disconnect"})
+            except Exception as e:
+                if self.data_logger:
+                    self.data_logger.log({
+                        "type": "ws_event",
+                        "feed": "polymarket_user",
+                        "event": "error",
+                        "error": f"{type(e).__name__}: {e}",
+                    })
+            finally:
+                self._ws = None
+                if self.on_state_change:
+                    self.on_state_change(False)
+
+            if self._running:
+                if connected_at is not None and time.monotonic() - connected_at >= self.MAX_RECONNECT_DELAY_SEC:
+                    delay = self.RECONNECT_DELAY_SEC
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY_SEC)
+
+    def stop(self):
+        """Stop the user stream (callable from any thread).
+
+        The user channel is silent unless the account trades, and keepalive
+        pings never wake the read loop, so the socket is closed to end it.
+        """
+        self._running = False
+        ws = self._ws
+        loop = self._loop
+        if ws is not None and loop is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(ws.close(), loop)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    def _process_message(self, message: Union[str, bytes]):
+        """Process incoming WebSocket message."""
+        try:
+            data = orjson.loads(message)
+        except orjson.JSONDecodeError:
+            return
+
+        for event in data if isinstance(data, list) else (data,):
+            self._handle_event(event)
+
+    def _handle_event(self, event: dict):
+        """Dispatch taker fills from MATCHED trade events."""
+        if event.get("event_type") != "trade" or event.get("status", "").upper() != "MATCHED":
+            return
+
+        order_id = event.get("taker_order_id")
+        if not order_id:
+            return
+
+        try:
+            size = float(event["size"])
+            price = float(event["price"])
+        except (KeyError, ValueError, TypeError):
+            return
+
+        if size > 0:
+            self.on_fill(order_id, size, price)
 
 
 class MockPriceStream:
@@ -254,7 +419,10 @@ class MockPriceStream:
     def __init__(self, token_ids: list[str], on_price_update: Callable):
         self.token_ids = token_ids
         self.on_price_update = on_price_update
-        self.prices = {tid: {"bid": 0.50, "ask": 0.51} for tid in token_ids}
+        # Same layout as PriceStream: bid/ask lists indexed by _idx
+        self._idx: dict[str, int] = {tid: i for i, tid in enumerate(token_ids)}
+        self._bids: list[float] = [0.50] * len(token_ids)
+        self._asks: list[float] = [0.51] * len(token_ids)
         self._running = False
 
     async def connect(self):
@@ -262,21 +430,31 @@ class MockPriceStream:
         self._running = True
         import random
 
+        uniform = random.uniform
+        bids = self._bids
+        asks = self._asks
+        # Tick against a fixed monotonic schedule so callback time doesn't
+        # accumulate into drift
+        loop = asyncio.get_running_loop()
+        next_t = loop.time()
         while self._running:
-            await asyncio.sleep(1)
-            for token_id in self.token_ids:
+            next_t += 1.0
+            await asyncio.sleep(max(0.0, next_t - loop.time()))
+            for i, token_id in enumerate(self.token_ids):
                 # Random walk
-                delta = random.uniform(-0.01, 0.01)
-                bid = max(0.01, min(0.99, self.prices[token_id]["bid"] + delta))
+                bid = max(0.01, min(0.99, bids[i] + uniform(-0.01, 0.01)))
                 ask = bid + 0.01
-                self.prices[token_id] = {"bid": bid, "ask": ask}
+                bids[i] = bid
+                asks[i] = ask
                 self.on_price_update(token_id, bid, ask)
 
     def stop(self):
         self._running = False
 
     def get_best_bid(self, token_id: str) -> Optional[float]:
-        return self.prices.get(token_id, {}).get("bid")
+        i = self._idx.get(token_id)
+        return None if i is None else self._bids[i]
 
     def get_best_ask(self, token_id: str) -> Optional[float]:
-        return self.prices.get(token_id, {}).get("ask")
+        i = self._idx.get(token_id)
+        return None if i is None else self._asks[i]